@@ -10,26 +10,68 @@ sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
 import time  # noqa: E402
+import hashlib  # noqa: E402
 import shutil  # noqa: E402
 import threading  # noqa: E402
-from dotenv import load_dotenv  # noqa: E402
-from garminconnect import Garmin  # noqa: E402
+import signal  # noqa: E402
+from collections import deque, OrderedDict  # noqa: E402
+from concurrent.futures import ThreadPoolExecutor  # noqa: E402
+from garminconnect import Garmin, GarminConnectAuthenticationError  # noqa: E402
 from watchdog.observers import Observer  # noqa: E402
 from watchdog.events import FileSystemEventHandler  # noqa: E402
 from pystray import Icon, MenuItem, Menu  # noqa: E402
-from PIL import Image, ImageDraw  # noqa: E402
 
 # Global state
 tray_icon = None
-status_messages = []
+client = None
+client_lock = threading.Lock()
+status_messages = deque(maxlen=10)
+status_lock = threading.Lock()
+menu_timer = None
+shutdown_event = threading.Event()
+# Files queued in or running on the upload pool
+pending_uploads = set()
+pending_lock = threading.Lock()
+# Delay before rebuilding the tray menu so bursts of messages cost one rebuild
+MENU_REFRESH_DELAY = 0.2
+# Quiet time after the last change before a watched file counts as fully written
+SETTLE_DELAY = 1.0
+# Pending settle timers, keyed by path
+_settle_timers = {}
+_settle_lock = threading.Lock()
+
+
+# Shared callback for the disabled status rows in the tray menu
+def _NOOP(icon=None, item=None):
+    pass
+
+
+# Load environment variables from .env next to the script.
+# Only plain KEY=value lines are supported (optional quotes, # comments);
+# variables already set in the environment win.
+def _load_env_fast(path=os.path.join(os.path.dirname(__file__), ".env")):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                key, _, value = line.partition("=")
+                os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
+    except FileNotFoundError:
+        pass
+
 
-# Load environment variables
-load_dotenv()
+_load_env_fast()
 GARMIN_USER = os.getenv("GARMIN_USER")
 GARMIN_PASSWORD = os.getenv("GARMIN_PASSWORD")
+UPLOAD_CONCURRENCY = int(os.getenv("UPLOAD_CONCURRENCY", "4"))
+LOGIN_ATTEMPTS = 5
 WATCH_FOLDER = r"C:\Users\Dell User\Dropbox\Apps\WahooFitness"
 UPLOADED_FOLDER = os.path.join(WATCH_FOLDER, "uploaded")
 ICON_PATH = os.path.join(os.path.dirname(__file__), "g.png")
+# Activity file extension (matched case-insensitively)
+FIT_SUFFIX = ".fit"
 MYWHOOSH_FOLDER = (
     r"C:\Users\Dell User\AppData\Local\Packages"
     r"\MyWhooshTechnologyService.644173E064ED2_eps1123pz0kt0"
@@ -38,51 +80,126 @@ MYWHOOSH_FOLDER = (
 MYWHOOSH_TRACK_FILE = os.path.join(
     os.path.dirname(__file__), "mywhoosh_processed.txt"
 )
+# Rewrite the append-only processed list once it grows past this size and
+# at least this many lines per unique entry (i.e. mostly duplicates)
+MYWHOOSH_TRACK_COMPACT_BYTES = 1024 * 1024
+MYWHOOSH_TRACK_COMPACT_RATIO = 2
 # Local cache for uploaded myWhoosh files
 MYWHOOSH_UPLOADED_FOLDER = os.path.join(
     os.path.dirname(__file__), "mywhoosh_uploaded"
 )
+# Content hashes keyed by (path, size, mtime_ns) so unchanged files are not re-read;
+# least recently used entries are dropped past SIGNATURE_CACHE_MAX
+SIGNATURE_CACHE_MAX = 512
+_signature_cache = OrderedDict()
+_signature_lock = threading.Lock()
+HASH_CHUNK_SIZE = 65536
+_hash_buffers = threading.local()
+# (size, mtime_ns) of files already in MYWHOOSH_UPLOADED_FOLDER, keyed by name
+_cached_mywhoosh = {}
+# The startup sweep and watcher events both check and update the processed set
+_mywhoosh_sync_lock = threading.Lock()
 
 
-# Add a message and update the tray tooltip
+# True for Wahoo/myWhoosh activity files, whatever the extension's case
+def is_fit_file(name):
+    return name.lower().endswith(FIT_SUFFIX)
+
+
+# Add a message and schedule a tray tooltip update
 def update_tray_tooltip(message):
+    global menu_timer
     print(message)
-    status_messages.append(message)
-    if len(status_messages) > 10:
-        status_messages.pop(0)
-    if tray_icon:
-        tray_icon.menu = Menu(
-            *(MenuItem(msg, lambda: None, enabled=False) for msg in reversed(
-                status_messages)),
-            MenuItem("Exit", exit_action)
-        )
+    with status_lock:
+        status_messages.append(message)
+        if menu_timer:
+            menu_timer.cancel()
+        menu_timer = threading.Timer(MENU_REFRESH_DELAY, _rebuild_menu)
+        menu_timer.daemon = True
+        menu_timer.start()
+
+
+# Rebuild the tray menu from the latest status messages
+def _rebuild_menu():
+    if not tray_icon:
+        return
+    with status_lock:
+        messages = list(status_messages)
+    tray_icon.menu = Menu(
+        *(MenuItem(msg, _NOOP, enabled=False) for msg in reversed(messages)),
+        EXIT_ITEM
+    )
 
 
 # Exit from tray menu
 def exit_action(icon, item):
     print("👋 Exiting uploader")
     icon.stop()
-    observer.stop()
+    shutdown_event.set()
+
+
+EXIT_ITEM = MenuItem("Exit", exit_action)
+
+
+# Log in on first use, retrying with exponential backoff
+def get_client():
+    global client
+    with client_lock:
+        if client:
+            return client
+        for attempt in range(LOGIN_ATTEMPTS):
+            try:
+                new_client = Garmin(GARMIN_USER, GARMIN_PASSWORD)
+                new_client.login()
+                client = new_client
+                update_tray_tooltip("✅ Logged in to Garmin Connect")
+                return client
+            except Exception as e:
+                print(f"❌ Login failed (attempt {attempt + 1}/{LOGIN_ATTEMPTS}):", e)
+                if attempt == LOGIN_ATTEMPTS - 1:
+                    raise
+                time.sleep(2 ** attempt)
+
+
+# Drop the cached client so the next upload logs in again
+def reset_client():
+    global client
+    with client_lock:
+        client = None
+
+
+# Move an uploaded file, falling back to a copy if it is locked
+def _finalize_move(src, dst):
+    try:
+        os.replace(src, dst)
+    except PermissionError:
+        print(f"⚠️ File locked, copying instead of moving")
+        shutil.copy2(src, dst)
+    except OSError:
+        # Uploaded folder on another volume - fall back to copy + delete
+        shutil.move(src, dst)
+    print(f"💾 Moved/copied to: {dst}")
 
 
 # Upload and move file
 def process_file(file_path, icon=None):
-    if not file_path.lower().endswith(".fit"):
+    if not is_fit_file(file_path):
         return
     print(f"📄 Uploading: {file_path}")
     try:
-        client.upload_activity(file_path)  # ← send the path directly
+        get_client().upload_activity(file_path)  # ← send the path directly
         print("✅ Upload successful!")
         if icon:
             icon.notify("✅ Upload successful")
         new_path = os.path.join(UPLOADED_FOLDER, os.path.basename(file_path))
-        # Try to move, if fails then just copy
-        try:
-            shutil.move(file_path, new_path)
-        except PermissionError:
-            print(f"⚠️ File locked, copying instead of moving")
-            shutil.copy2(file_path, new_path)
-        print(f"💾 Moved/copied to: {new_path}")
+        _finalize_move(file_path, new_path)
+        _cache_mywhoosh_original(os.path.basename(file_path))
+    except GarminConnectAuthenticationError as e:
+        # Session expired - log in again on the next upload
+        print(f"❌ Upload failed, Garmin session expired:", e)
+        reset_client()
+        if icon:
+            icon.notify(f"❌ Upload failed: {e}")
     except Exception as e:
         error_msg = str(e)
         print(f"⚠️ Upload issue: {error_msg}")
@@ -90,65 +207,160 @@ def process_file(file_path, icon=None):
         if "409" in error_msg or "Conflict" in error_msg:
             print(f"ℹ️ Activity already exists in Garmin, moving file...")
             new_path = os.path.join(UPLOADED_FOLDER, os.path.basename(file_path))
-            # Try to move, if fails then just copy
-            try:
-                shutil.move(file_path, new_path)
-            except PermissionError:
-                print(f"⚠️ File locked, copying instead of moving")
-                shutil.copy2(file_path, new_path)
-            print(f"💾 Moved/copied to: {new_path}")
+            _finalize_move(file_path, new_path)
+            _cache_mywhoosh_original(os.path.basename(file_path))
         else:
             print(f"❌ Upload failed:", e)
             if icon:
                 icon.notify(f"❌ Upload failed: {e}")
 
 
+# Run callback(path) once the file's size/mtime have held still for SETTLE_DELAY.
+# Every call restarts the wait, so a burst of events costs one callback and the
+# watchdog thread never sleeps. With pending_only, only an already waiting file
+# is restarted.
+def settle_then(path, callback, pending_only=False):
+    try:
+        st = os.stat(path)
+        state = (st.st_size, st.st_mtime_ns)
+    except OSError:
+        state = None
+    with _settle_lock:
+        timer = _settle_timers.get(path)
+        if timer:
+            timer.cancel()
+        elif pending_only:
+            return
+        timer = threading.Timer(SETTLE_DELAY, _settle_check, args=(path, state, callback))
+        timer.daemon = True
+        _settle_timers[path] = timer
+        timer.start()
+
+
+def _settle_check(path, state, callback):
+    with _settle_lock:
+        if _settle_timers.get(path) is not threading.current_thread():
+            return  # Superseded by a newer event
+    try:
+        st = os.stat(path)
+    except OSError:
+        with _settle_lock:
+            if _settle_timers.get(path) is threading.current_thread():
+                del _settle_timers[path]
+        return  # Gone (moved or deleted) before it settled
+    if (st.st_size, st.st_mtime_ns) != state:
+        settle_then(path, callback)  # Still being written - wait again
+        return
+    with _settle_lock:
+        if _settle_timers.get(path) is not threading.current_thread():
+            return
+        del _settle_timers[path]
+    callback(path)
+
+
 # File watcher handler
 class FileHandler(FileSystemEventHandler):
     def __init__(self, icon):
         self.icon = icon
 
     def on_created(self, event):
-        if not event.is_directory and event.src_path.lower().endswith(".fit"):
+        if not event.is_directory and is_fit_file(event.src_path):
             update_tray_tooltip(f"📂 New file detected: {event.src_path}")
-            time.sleep(1)  # Let Dropbox finish syncing
-            process_file(event.src_path, self.icon)
+            # Let Dropbox finish syncing
+            settle_then(event.src_path, self._upload)
+
+    def on_modified(self, event):
+        # Writes to a file that is still settling push its upload back
+        if not event.is_directory:
+            settle_then(event.src_path, self._upload, pending_only=True)
+
+    def _upload(self, path):
+        submit_upload(path, self.icon)
+
+
+# Queue a file for upload unless it is already queued or uploading
+def submit_upload(file_path, icon=None):
+    with pending_lock:
+        if file_path in pending_uploads:
+            return
+        pending_uploads.add(file_path)
+    future = upload_pool.submit(process_file, file_path, icon)
+    future.add_done_callback(lambda _: _finish_upload(file_path))
+
+
+def _finish_upload(file_path):
+    with pending_lock:
+        pending_uploads.discard(file_path)
 
 
 # Run folder check and watcher
 def run_watcher(icon):
-    update_tray_tooltip("🔍 Checking existing files...")
-    for filename in os.listdir(WATCH_FOLDER):
-        full_path = os.path.join(WATCH_FOLDER, filename)
-        if os.path.isfile(full_path) and filename.lower().endswith(".fit"):
-            update_tray_tooltip(f"👀 Found existing file: {full_path}")
-            process_file(full_path, icon)
-    update_tray_tooltip(f"👀 Watching folder: {WATCH_FOLDER}")
+    # Start watching first so new files overlap with the backlog uploads
     handler = FileHandler(icon)
     observer.schedule(handler, path=WATCH_FOLDER, recursive=False)
     observer.start()
+    update_tray_tooltip("🔍 Checking existing files...")
+    with os.scandir(WATCH_FOLDER) as it:
+        for entry in it:
+            if is_fit_file(entry.name) and entry.is_file():
+                update_tray_tooltip(f"👀 Found existing file: {entry.path}")
+                submit_upload(entry.path, icon)
+    update_tray_tooltip(f"👀 Watching folder: {WATCH_FOLDER}")
 
 
 def _load_processed_mywhoosh():
     processed = set()
     if os.path.exists(MYWHOOSH_TRACK_FILE):
+        lines = 0
         try:
             with open(MYWHOOSH_TRACK_FILE, "r", encoding="utf-8") as f:
                 for line in f:
                     line = line.strip()
                     if line:
+                        lines += 1
                         processed.add(line)
         except Exception as e:
             print("⚠️ Could not read myWhoosh processed file list:", e)
+        else:
+            # A list of unique entries would not shrink, so only rewrite one full of duplicates
+            if (os.path.getsize(MYWHOOSH_TRACK_FILE) > MYWHOOSH_TRACK_COMPACT_BYTES
+                    and lines >= MYWHOOSH_TRACK_COMPACT_RATIO * len(processed)):
+                _save_processed_mywhoosh(processed)
     return processed
 
 
+def _sha256_file(file_path):
+    """Hash a file into a reused per-thread buffer without extra copies."""
+    buf = getattr(_hash_buffers, "buf", None)
+    if buf is None:
+        buf = _hash_buffers.buf = bytearray(HASH_CHUNK_SIZE)
+    mv = memoryview(buf)
+    h = hashlib.sha256(usedforsecurity=False)
+    with open(file_path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(mv)
+            if not n:
+                break
+            h.update(mv if n == HASH_CHUNK_SIZE else mv[:n])
+    return h.hexdigest()
+
+
 def _get_file_signature(file_path):
-    """Create a unique signature for a file based on name and modification time."""
+    """Create a unique signature for a file based on its content."""
     try:
-        mod_time = os.path.getmtime(file_path)
-        size = os.path.getsize(file_path)
-        return f"{os.path.basename(file_path)}_{mod_time}_{size}"
+        st = os.stat(file_path)
+        pre_check = (file_path, st.st_size, st.st_mtime_ns)
+        with _signature_lock:
+            signature = _signature_cache.get(pre_check)
+            if signature is not None:
+                _signature_cache.move_to_end(pre_check)
+                return signature
+        signature = _sha256_file(file_path)
+        with _signature_lock:
+            _signature_cache[pre_check] = signature
+            if len(_signature_cache) > SIGNATURE_CACHE_MAX:
+                _signature_cache.popitem(last=False)
+        return signature
     except Exception:
         return os.path.basename(file_path)
 
@@ -162,6 +374,118 @@ def _save_processed_mywhoosh(processed):
         print("⚠️ Could not write myWhoosh processed file list:", e)
 
 
+def _append_processed_mywhoosh(file_sig):
+    try:
+        with open(MYWHOOSH_TRACK_FILE, "a", encoding="utf-8", buffering=1) as f:
+            f.write(file_sig + "\n")
+    except Exception as e:
+        print("⚠️ Could not write myWhoosh processed file list:", e)
+
+
+# Copy a new or updated myWhoosh activity into the watch folder
+def _sync_mywhoosh_file(full_path, processed):
+    with _mywhoosh_sync_lock:
+        _sync_mywhoosh_file_locked(full_path, processed)
+
+
+def _sync_mywhoosh_file_locked(full_path, processed):
+    filename = os.path.basename(full_path)
+    file_sig = _get_file_signature(full_path)
+
+    # Check if this file signature has changed (newer version)
+    if file_sig in processed:
+        return
+    # Lists written by older versions keyed files on name/mtime/size (and briefly, for big
+    # files, name/size/mtime_ns); record the hash for a match instead of uploading it again
+    try:
+        st = os.stat(full_path)
+    except OSError:
+        st = None
+    if st is not None and not processed.isdisjoint((
+            f"{filename}_{st.st_mtime}_{st.st_size}",
+            f"{filename}_{st.st_size}_{st.st_mtime_ns}")):
+        processed.add(file_sig)
+        _append_processed_mywhoosh(file_sig)
+        return
+
+    # Found a new or updated file - upload it
+    print(f"📤 Found new version: {filename}")
+    update_tray_tooltip(f"📤 Found: {filename}")
+
+    # Copy to watch folder
+    dest_path = os.path.join(WATCH_FOLDER, filename)
+    try:
+        shutil.copy2(full_path, dest_path)
+        print(f"✓ Copied: {filename}")
+    except Exception as e:
+        print(f"⚠️ Could not copy file: {e}")
+        return
+
+    # Mark as processed
+    processed.add(file_sig)
+    _append_processed_mywhoosh(file_sig)
+
+
+# Cache the myWhoosh original once its copy has been uploaded
+def _cache_mywhoosh_original(filename):
+    source_path = os.path.join(MYWHOOSH_FOLDER, filename)
+    try:
+        src_st = os.stat(source_path)
+    except OSError:
+        return
+    # copy2 keeps mtime, so an identical cached copy has the same size/mtime
+    src_key = (src_st.st_size, src_st.st_mtime_ns)
+    if _cached_mywhoosh.get(filename) == src_key:
+        return
+    dest_cache_path = os.path.join(MYWHOOSH_UPLOADED_FOLDER, filename)
+    try:
+        # Copy to our local mywhoosh_uploaded cache (can't delete from myWhoosh as it's system cache)
+        shutil.copy2(source_path, dest_cache_path)
+        _cached_mywhoosh[filename] = src_key
+        print(f"💾 myWhoosh file cached: {filename}")
+    except Exception as e:
+        print(f"⚠️ Could not cache myWhoosh file: {e}")
+
+
+def _load_cached_mywhoosh():
+    try:
+        with os.scandir(MYWHOOSH_UPLOADED_FOLDER) as it:
+            for entry in it:
+                if entry.is_file():
+                    st = entry.stat()
+                    _cached_mywhoosh[entry.name] = (st.st_size, st.st_mtime_ns)
+    except OSError as e:
+        print("⚠️ Could not read myWhoosh cache folder:", e)
+
+
+# myWhoosh cache folder handler
+class MyWhooshHandler(FileSystemEventHandler):
+    def __init__(self, processed):
+        self.processed = processed
+
+    def on_created(self, event):
+        self._handle(event)
+
+    def on_modified(self, event):
+        self._handle(event)
+
+    def on_moved(self, event):
+        # Saved to a temp file, then renamed into place
+        self._handle(event, event.dest_path)
+
+    def _handle(self, event, path=None):
+        path = path or event.src_path
+        if not event.is_directory and is_fit_file(path):
+            # Let myWhoosh finish writing
+            settle_then(path, self._sync)
+
+    def _sync(self, path):
+        try:
+            _sync_mywhoosh_file(path, self.processed)
+        except Exception as e:
+            print(f"❌ Error while monitoring myWhoosh: {e}")
+
+
 def run_mywhoosh_sync():
     if not os.path.isdir(MYWHOOSH_FOLDER):
         print(f"ℹ️ myWhoosh folder not found, skipping sync: {MYWHOOSH_FOLDER}")
@@ -170,77 +494,47 @@ def run_mywhoosh_sync():
     update_tray_tooltip(f"🔄 Monitoring myWhoosh folder: {MYWHOOSH_FOLDER}")
     print(f"🔍 Starting myWhoosh monitor...")
     processed = _load_processed_mywhoosh()
-    
-    while True:
-        try:
-            for filename in os.listdir(MYWHOOSH_FOLDER):
-                if not filename.lower().endswith(".fit"):
-                    continue
-
-                full_path = os.path.join(MYWHOOSH_FOLDER, filename)
-                file_sig = _get_file_signature(full_path)
+    _load_cached_mywhoosh()
 
-                # Check if this file signature has changed (newer version)
-                if file_sig in processed:
-                    continue
+    # Watch first so files written during the sweep are not missed, then one sweep
+    # for files written before the watcher started; events drive the rest
+    observer.schedule(MyWhooshHandler(processed), path=MYWHOOSH_FOLDER, recursive=False)
+    try:
+        # Names already uploaded to Dropbox, listed once instead of a stat per file
+        with os.scandir(UPLOADED_FOLDER) as it:
+            uploaded_set = frozenset(e.name for e in it if e.is_file())
 
-                # Found a new or updated file - upload it
-                print(f"📤 Found new version: {filename}")
-                update_tray_tooltip(f"📤 Found: {filename}")
-                
-                # Copy to watch folder
-                dest_path = os.path.join(WATCH_FOLDER, filename)
-                try:
-                    shutil.copy2(full_path, dest_path)
-                    print(f"✓ Copied: {filename}")
-                    time.sleep(1)  # Give system time to process
-                except Exception as e:
-                    print(f"⚠️ Could not copy file: {e}")
+        with os.scandir(MYWHOOSH_FOLDER) as it:
+            for entry in it:
+                if not is_fit_file(entry.name):
                     continue
+                _sync_mywhoosh_file(entry.path, processed)
 
-                # Mark as processed
-                processed.add(file_sig)
-                _save_processed_mywhoosh(processed)
-            
-            # Also check if uploaded files exist and move myWhoosh originals
-            for filename in os.listdir(MYWHOOSH_FOLDER):
-                if not filename.lower().endswith(".fit"):
-                    continue
-                
                 # Check if this file has been uploaded to Dropbox
-                uploaded_in_dropbox = os.path.join(UPLOADED_FOLDER, filename)
-                if os.path.exists(uploaded_in_dropbox):
-                    # File was successfully uploaded, move the myWhoosh original
-                    source_path = os.path.join(MYWHOOSH_FOLDER, filename)
-                    dest_cache_path = os.path.join(MYWHOOSH_UPLOADED_FOLDER, filename)
-                    
-                    try:
-                        # Copy to our local mywhoosh_uploaded cache (can't delete from myWhoosh as it's system cache)
-                        shutil.copy2(source_path, dest_cache_path)
-                        print(f"💾 myWhoosh file cached: {filename}")
-                    except Exception as e:
-                        print(f"⚠️ Could not cache myWhoosh file: {e}")
-
-        except Exception as e:
-            print(f"❌ Error while monitoring myWhoosh: {e}")
-
-        # Check for updates every 5 minutes (300 seconds) - activities don't change that frequently
-        time.sleep(300)
+                if entry.name in uploaded_set:
+                    _cache_mywhoosh_original(entry.name)
+    except Exception as e:
+        print(f"❌ Error while monitoring myWhoosh: {e}")
 
 
 # Create system tray icon
 def create_icon():
+    # Pillow is only needed here, so import it on demand
+    from PIL import Image
     try:
         icon_image = Image.open(ICON_PATH)
+        icon_image.load()
     except Exception:
+        from PIL import ImageDraw
         # Fallback to blue "G" if image not found
         icon_image = Image.new("RGB", (64, 64), (30, 144, 255))
         draw = ImageDraw.Draw(icon_image)
         draw.text((22, 16), "G", fill="white")
+    with status_lock:
+        messages = list(status_messages)
     return Icon("GarminUploader", icon_image, "Garmin Uploader", menu=Menu(
-        *(MenuItem(msg, lambda: None, enabled=False) for msg in reversed(
-            status_messages)),
-        MenuItem("Exit", exit_action)
+        *(MenuItem(msg, _NOOP, enabled=False) for msg in reversed(messages)),
+        EXIT_ITEM
     ))
 
 
@@ -248,16 +542,8 @@ def create_icon():
 os.makedirs(UPLOADED_FOLDER, exist_ok=True)
 os.makedirs(MYWHOOSH_UPLOADED_FOLDER, exist_ok=True)
 
-# Login
-try:
-    client = Garmin(GARMIN_USER, GARMIN_PASSWORD)
-    client.login()
-    update_tray_tooltip("✅ Logged in to Garmin Connect")
-except Exception as e:
-    print("❌ Login failed:", e)
-    sys.exit(1)
-
 # Start everything
+upload_pool = ThreadPoolExecutor(max_workers=UPLOAD_CONCURRENCY)
 observer = Observer()
 tray_icon = create_icon()
 threading.Thread(target=run_watcher, args=(tray_icon,), daemon=True).start()
@@ -269,13 +555,17 @@ print("📊 System tray icon is running")
 print("🔄 Watching for new workout files...")
 print("\nPress Ctrl+C to stop the uploader\n")
 
-# Keep the main thread alive
-try:
-    while True:
-        time.sleep(1)
-except KeyboardInterrupt:
-    print("\n👋 Shutting down ConnectUploader...")
-    observer.stop()
-    observer.join()
-    tray_icon.stop()
-    sys.exit(0)
+# Keep the main thread alive until Exit or Ctrl+C
+signal.signal(signal.SIGINT, lambda *args: shutdown_event.set())
+# Windows cannot interrupt an untimed lock wait, so wake there now and then
+# to let the SIGINT handler run
+wait_timeout = 5 if os.name == "nt" else None
+while not shutdown_event.wait(wait_timeout):
+    pass
+
+print("\n👋 Shutting down ConnectUploader...")
+observer.stop()
+observer.join()
+upload_pool.shutdown(wait=True)
+tray_icon.stop()
+sys.exit(0)
@@ -15,20 +15,40 @@ import json
 import os
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import datetime
 import logging
 import base64
+import io
+import hashlib
+import re
+from collections import deque
+from bisect import bisect_right
 import tempfile
-from garminconnect import Garmin
 from PIL import Image, ImageTk
-from pystray import Icon, Menu, MenuItem
+BILINEAR = getattr(Image, 'Resampling', Image).BILINEAR  # Image.Resampling is Pillow 9.1+
 import webbrowser
 import shutil
+import subprocess
+import importlib.util
+# pywin32 might not be available in all environments; win32com.client itself is
+# imported on first use (in a worker thread) rather than at startup
+HAS_WIN32COM = importlib.util.find_spec("win32com") is not None
 try:
-    import win32com.client
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 except ImportError:
-    win32com = None  # This module might not be available in all environments
+    AESGCM = None  # Optional; passwords fall back to the legacy XOR scheme
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional faster JSON encoder; the json module is used otherwise
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None  # Optional; without it auto-sync only rescans on its timer
+    FileSystemEventHandler = object
 
 # Configuration file
 CONFIG_FILE = "uploader_config.json"
@@ -68,30 +88,210 @@ LOG_FILE = os.path.join(LOG_DIR, "garmin_uploader.log")
 # Upload log (single file; month separators written when month changes)
 UPLOAD_LOG_FILE = os.path.join(LOG_DIR, "garmin_uploads.log")
 MAX_LOG_SIZE_MB = 10  # Rotate log after 10MB
+UPLOAD_WORKERS = 4  # Concurrent Garmin uploads per folder sync
+UPLOAD_ATTEMPTS = 3  # Tries per file when Garmin or the network fails transiently (1 s, then 2 s backoff)
+UPLOADED_MANIFEST = "uploaded.json"  # Handled-file keys, kept in each folder's uploaded/ subfolder
+LOG_TAIL_BYTES = 64 * 1024  # How much of the log end to scan for last sync info
+LOG_VIEW_TAIL_BYTES = 256 * 1024  # How much of the log end the viewer shows at first
+LOG_VIEW_CHUNK_CHARS = 64 * 1024  # Insert size when the viewer loads the rest of the log
+LOG_IDENTITY_BYTES = 256  # Leading bytes the log viewer compares to tell whether the log was rotated
+LOG_RING_RECORDS = 2000  # Recent records kept in memory; the viewer uses them once this many exist
+STATUS_FLUSH_MS = 100  # Coalesce status label updates to at most one per this many ms
+SEARCH_DEBOUNCE_MS = 120  # Log viewer search-as-you-type runs once typing pauses this long
+MONITOR_BACKOFF_MAX_S = 30 * 60  # Longest timed rescan while folder watching covers new files
+WATCH_SETTLE_MS = 5000  # Auto-sync runs once .fit file events in a watched folder have been quiet this long
+RESIZE_DEBOUNCE_MS = 30  # Settings canvas recomputes its scroll region once resizing pauses this long
+NEWLINE_RE = re.compile('\n')  # Line starts for the log viewer's offset -> line.col lookup
+ACTIVITY_COUNT_RE = re.compile(r'(\d+) activit')  # "Sync completed: N activities uploaded"
+# Auto-start shortcut in the user's Startup folder (fixed for the session)
+STARTUP_FOLDER = os.path.join(os.getenv('APPDATA', ''), 'Microsoft', 'Windows', 'Start Menu', 'Programs', 'Startup')
+AUTOSTART_SHORTCUT_PATH = os.path.join(STARTUP_FOLDER, 'GarminUploader.lnk')
+STARTUP_FLAGS = frozenset(('--minimized', '--startup'))  # Command-line flags used by the auto-start shortcut
+PS_SENTINEL = "===END==="  # Marks the end of each reply from the shared PowerShell process
+# Shortcut creation for the PowerShell fallback; fields are filled with ps_quote()d values
+PS_SHORTCUT_TEMPLATE = (
+    '$Shortcut = $WshShell.CreateShortcut({shortcut}); '
+    '$Shortcut.TargetPath = {target}; '
+    '$Shortcut.Arguments = {arguments}; '
+    '$Shortcut.WorkingDirectory = {working_dir}; '
+    '$Shortcut.WindowStyle = 7; '
+    '$Shortcut.Description = "Garmin Connect Uploader"; '
+    '$Shortcut.Save()'
+)
 
 # Setup logging with rotation (standard format without icons by default)
-from logging.handlers import RotatingFileHandler
+import atexit
+import queue
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+
+class LogFormatter(logging.Formatter):
+    """Standard log format; separator records render as a blank line"""
+    def format(self, record):
+        if getattr(record, 'separator', False):
+            return ""
+        return super().format(record)
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler with a large write buffer and periodic flushing.
+
+    Records are flushed at most every FLUSH_INTERVAL seconds, or straight
+    away for ERROR and above so failures are never lost in the buffer.
+    The file size is tracked in-process, so deciding whether to rotate
+    does not stat the log on every record.
+    """
+    FLUSH_INTERVAL = 5.0
+
+    def __init__(self, *args, buffer_size=64 * 1024, **kwargs):
+        self.buffer_size = buffer_size  # Needed by _open() during __init__
+        self._flush_timer = None
+        super().__init__(*args, **kwargs)
+        try:
+            self._bytes_written = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._bytes_written = 0
+        # Never rotate anything other than a regular file (bpo-45401)
+        self._can_rotate = not os.path.exists(self.baseFilename) or os.path.isfile(self.baseFilename)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def _would_overflow(self, length):
+        return self._can_rotate and self.maxBytes > 0 and self._bytes_written + length >= self.maxBytes
+
+    def _byte_length(self, msg):
+        """Bytes msg takes on disk: encoded size, with text mode writing os.linesep for each newline"""
+        size = len(msg.encode(self.encoding or 'utf-8', self.errors or 'replace'))
+        return size + msg.count('\n') * (len(os.linesep) - 1)
+
+    def shouldRollover(self, record):
+        return self._would_overflow(self._byte_length(self.format(record) + self.terminator))
+
+    def doRollover(self):
+        super().doRollover()
+        self._bytes_written = 0
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            length = self._byte_length(msg)
+            if self._would_overflow(length):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self._bytes_written += length
+            if record.levelno >= logging.ERROR:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        finally:
+            self.release()
+        super().flush()
+
+
+class FitFileHandler(FileSystemEventHandler):
+    """Watchdog handler that calls on_fit_file() when a .fit file appears or changes in one folder.
+
+    Only files directly in the watched folder count, so moving uploads into
+    its uploaded/ subfolder does not trigger another sync.
+    """
+
+    # Events that can bring in new file content (not deleted, opened, closed_no_write, ...)
+    EVENT_TYPES = frozenset(('created', 'modified', 'moved'))
 
-file_handler = RotatingFileHandler(
+    def __init__(self, folder, on_fit_file):
+        super().__init__()
+        self._folder = os.path.normcase(os.path.abspath(folder))
+        self._on_fit_file = on_fit_file
+
+    def on_any_event(self, event):
+        if event.is_directory or event.event_type not in self.EVENT_TYPES:
+            return
+        # A move counts for where the file ended up
+        path = os.fsdecode(event.dest_path if event.event_type == 'moved' else event.src_path)
+        if (path.lower().endswith('.fit')
+                and os.path.normcase(os.path.dirname(os.path.abspath(path))) == self._folder):
+            self._on_fit_file()
+
+
+class LogRingHandler(logging.Handler):
+    """Keeps the most recent formatted records in memory for the log viewer"""
+    def __init__(self, capacity):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+
+    def emit(self, record):
+        try:
+            self.records.append(self.format(record))
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def is_full(self):
+        return len(self.records) == self.records.maxlen
+
+    def text(self):
+        self.acquire()
+        try:
+            lines = list(self.records)
+        finally:
+            self.release()
+        return '\n'.join(lines) + '\n'
+
+
+log_formatter = LogFormatter('%(asctime)s - %(levelname)s - %(message)s')
+
+file_handler = BufferedRotatingFileHandler(
     LOG_FILE,
     maxBytes=MAX_LOG_SIZE_MB * 1024 * 1024,  # 10MB
     backupCount=3,  # Keep 3 backup files (~ 3 months of logs)
     encoding='utf-8'
 )
-file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+file_handler.setFormatter(log_formatter)
 
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+log_handlers = [file_handler]
+# Windowed builds have no console (sys.stderr is None); don't format every record for nothing
+if sys.stderr is not None:
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(log_formatter)
+    log_handlers.append(console_handler)
+
+log_ring_handler = LogRingHandler(LOG_RING_RECORDS)
+log_ring_handler.setFormatter(log_formatter)
+log_handlers.append(log_ring_handler)
+
+# Callers only enqueue records; a background thread does the disk writes
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
 
 logging.basicConfig(
     level=logging.INFO,
-    handlers=[file_handler, console_handler]
+    handlers=[QueueHandler(log_queue)]
 )
 logger = logging.getLogger(__name__)
 
 # Dedicated upload-only logger (separate file, no rotation; date markers in file)
 upload_logger = logging.getLogger("upload_log")
-upload_handler = logging.FileHandler(UPLOAD_LOG_FILE, encoding='utf-8')
+upload_handler = BufferedRotatingFileHandler(UPLOAD_LOG_FILE, maxBytes=0, encoding='utf-8')  # maxBytes=0: never rotates
 upload_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 upload_logger.setLevel(logging.INFO)
 # Avoid duplicate propagation to root; we want a clean uploads-only file
@@ -117,56 +317,234 @@ def log_info(message):
 
 def log_separator():
     """Add a blank line separator in logs for better grouping"""
-    # Write directly to handlers to create a true blank line
-    for handler in logger.handlers:
-        if isinstance(handler, logging.FileHandler):
-            handler.stream.write("\n")
-            handler.flush()
-
-# Simple encryption key (better than plain text)
-# In production, consider using cryptography library
+    # LogFormatter renders this record as a true blank line
+    logger.info("", extra={'separator': True})
+
+# Password encryption key (better than plain text). Passwords are sealed with
+# AES-GCM when the cryptography package is available; configs written with the
+# older XOR scheme are still read.
 ENCRYPTION_KEY = "GarminUploaderV1SecretKey2024"
+ENCRYPTION_KEY_BYTES = ENCRYPTION_KEY.encode('latin-1')
+ENCRYPTION_SALT = b"GarminUploaderConfigSalt"
+AES_PASSWORD_PREFIX = "aesgcm:"  # Marks AES-GCM values in uploader_config.json
+XOR_UTF8_PASSWORD_PREFIX = "xorutf8:"  # Marks XOR values of passwords outside latin-1
+_aes_key = None  # Derived once, PBKDF2 is deliberately slow (main() starts it in the background)
+_aes_key_lock = threading.Lock()
+
+
+def _get_aes_key():
+    """Derive (once) the 256-bit AES key from ENCRYPTION_KEY; waits for a derivation already running"""
+    global _aes_key
+    with _aes_key_lock:
+        if _aes_key is None:
+            _aes_key = hashlib.pbkdf2_hmac('sha256', ENCRYPTION_KEY.encode('utf-8'), ENCRYPTION_SALT, 100_000, 32)
+    return _aes_key
+
+
+def _xor_with_key(data):
+    """XOR bytes with the repeating key as one wide-int operation"""
+    key_len = len(ENCRYPTION_KEY_BYTES)
+    key = (ENCRYPTION_KEY_BYTES * (len(data) // key_len + 1))[:len(data)]
+    return (int.from_bytes(data, 'little') ^ int.from_bytes(key, 'little')).to_bytes(len(data), 'little')
 
 
 def encrypt_password(password):
-    """Simple encryption using base64 and XOR"""
+    """Encrypt password with AES-GCM (base64 and XOR without cryptography)"""
     if not password:
         return ""
-    # XOR with key
-    encrypted = ''.join(
-        chr(ord(c) ^ ord(ENCRYPTION_KEY[i % len(ENCRYPTION_KEY)]))
-        for i, c in enumerate(password)
-    )
+    if AESGCM:
+        nonce = os.urandom(12)
+        sealed = AESGCM(_get_aes_key()).encrypt(nonce, password.encode('utf-8'), None)
+        return AES_PASSWORD_PREFIX + base64.b64encode(nonce + sealed).decode('utf-8')
+    # XOR with key (latin-1 keeps the byte layout of existing configs; passwords
+    # latin-1 can't hold are stored as marked UTF-8 instead of failing to save)
+    try:
+        encrypted, prefix = _xor_with_key(password.encode('latin-1')), ""
+    except UnicodeEncodeError:
+        encrypted, prefix = _xor_with_key(password.encode('utf-8')), XOR_UTF8_PASSWORD_PREFIX
     # Base64 encode
-    return base64.b64encode(encrypted.encode('latin-1')).decode('utf-8')
+    return prefix + base64.b64encode(encrypted).decode('utf-8')
 
 
 def decrypt_password(encrypted_password):
-    """Decrypt password"""
+    """Decrypt password (AES-GCM or legacy XOR)"""
     if not encrypted_password:
         return ""
     try:
-        # Base64 decode
-        decoded = base64.b64decode(
-            encrypted_password.encode('utf-8')
-        ).decode('latin-1')
+        if encrypted_password.startswith(AES_PASSWORD_PREFIX):
+            if not AESGCM:
+                return ""  # Saved by a build with cryptography; can't read it here
+            raw = base64.b64decode(encrypted_password[len(AES_PASSWORD_PREFIX):].encode('utf-8'), validate=True)
+            return AESGCM(_get_aes_key()).decrypt(raw[:12], raw[12:], None).decode('utf-8')
+        encoding = 'latin-1'
+        if encrypted_password.startswith(XOR_UTF8_PASSWORD_PREFIX):
+            encrypted_password, encoding = encrypted_password[len(XOR_UTF8_PASSWORD_PREFIX):], 'utf-8'
+        # Base64 decode (validate: a corrupt value fails here rather than decrypting to junk)
+        decoded = base64.b64decode(encrypted_password.encode('utf-8'), validate=True)
         # XOR with key to decrypt
-        decrypted = ''.join(
-            chr(ord(c) ^ ord(ENCRYPTION_KEY[i % len(ENCRYPTION_KEY)]))
-            for i, c in enumerate(decoded)
-        )
-        return decrypted
+        return _xor_with_key(decoded).decode(encoding)
     except Exception:  # noqa: E722
         return ""  # Return empty if decryption fails
 
 
+def log_timestamp(timestamp_str):
+    """Return '2025-12-29 01:26:34' from a log timestamp like '2025-12-29 01:26:34,358'"""
+    timestamp = timestamp_str[:19]
+    if len(timestamp) != 19 or timestamp[4] != '-' or timestamp[10] != ' ' or timestamp[13] != ':':
+        raise ValueError(f"Not a log timestamp: {timestamp_str!r}")
+    return timestamp
+
+
+def http_status_code(exc):
+    """
+    Return the HTTP status behind a garminconnect/garth/requests error, or None.
+    garth's GarthHTTPError keeps the requests error in .error, and garminconnect
+    re-raises with the original as __cause__, so follow both.
+    """
+    for _ in range(5):  # Exception chains here are short
+        if exc is None:
+            break
+        for candidate in (exc, getattr(exc, 'error', None)):
+            status = getattr(getattr(candidate, 'response', None), 'status_code', None)
+            if status is not None:
+                return status
+        exc = exc.__cause__ or exc.__context__
+    return None
+
+
+def is_transient_http_error(exc):
+    """True for upload failures worth retrying: 429/5xx responses, connection errors and timeouts"""
+    status = http_status_code(exc)
+    if status is not None:
+        return status == 429 or status >= 500
+    import requests  # Already loaded by garminconnect whenever an upload can fail
+    network_errors = (requests.ConnectionError, requests.Timeout, ConnectionError, TimeoutError)
+    for _ in range(5):
+        if exc is None:
+            break
+        if isinstance(exc, network_errors) or isinstance(getattr(exc, 'error', None), network_errors):
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+def ps_quote(value):
+    """Quote a string as a PowerShell single-quoted literal (no $ expansion, ' doubled)"""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def json_dumps(data):
+    """Serialize config data to indented JSON bytes"""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def json_loads(data):
+    """Parse JSON bytes"""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Help window contents (shown by show_wahoo_help / show_mywhoosh_help)
+WAHOO_HELP_TEXT = """1. Create a Dropbox account (free):
+   → Go to dropbox.com and sign up
+
+2. Connect Wahoo to Dropbox:
+   → Open Wahoo ELEMNT app on your phone
+   → Go to Settings → Cloud Services
+   → Enable Dropbox and authorize
+
+3. Install Dropbox on your PC:
+   → Download from dropbox.com/install
+   → Sign in with your account
+   → Let it sync
+
+4. Find the Wahoo folder:
+   → Open File Explorer
+   → Navigate to:
+   
+   C:\\Users\\YourName\\Dropbox\\Apps\\WahooFitness
+   
+   → Copy this path and paste it in the Wahoo Folder field
+
+Note: The app will automatically create an 'uploaded' subfolder to move processed .fit files there.
+
+You can select and copy text from this window!"""
+
+MYWHOOSH_HELP_TEXT = """MyWhoosh only keeps the LAST activity in its cache folder.
+This folder is hidden deep in Windows AppData.
+
+How to find it:
+
+1. Open File Explorer
+
+2. In the address bar, paste this and press Enter:
+
+   %localappdata%\\Packages
+
+3. Look for a folder starting with:
+
+   MyWhooshTechnologyService.644173E064ED2
+   
+   Full example:
+   MyWhooshTechnologyService.644173E064ED2_eps1123pz0kt0
+
+4. Open that folder, then navigate to:
+
+   LocalCache\\Local\\MyWhoosh\\Content\\Data
+
+5. Full path example (copy this format):
+
+   C:\\Users\\YourName\\AppData\\Local\\Packages\\MyWhooshTechnologyService.644173E064ED2_eps1123pz0kt0\\LocalCache\\Local\\MyWhoosh\\Content\\Data
+
+6. Copy YOUR path and paste it in the MyWhoosh Folder field
+
+Note: MyWhoosh typically only keeps the most recent activity file (usually MyNewActivity-5.5.1.fit or similar) in this folder. The app will process ALL .fit files it finds there.
+
+You can select and copy text from this window!"""
+
+
 class ConnectUploaderGUI:
+    # Static settings-grid widgets for create_widgets: (kind, widget options, grid options)
+    _STATIC_LAYOUT = (
+        # Garmin Settings
+        ('label', {'text': "🔑 Garmin Connect Settings", 'style': 'Header.TLabel'},
+         {'row': 1, 'column': 0, 'columnspan': 3, 'sticky': tk.W, 'pady': (10, 5)}),
+        ('label', {'text': "Email:"}, {'row': 2, 'column': 0, 'sticky': tk.W, 'pady': 5}),
+        ('label', {'text': "Password:"}, {'row': 3, 'column': 0, 'sticky': tk.W, 'pady': 5}),
+        # Folder Settings
+        ('label', {'text': "📁 Folder Settings", 'style': 'Header.TLabel'},
+         {'row': 4, 'column': 0, 'columnspan': 3, 'sticky': tk.W, 'pady': (20, 5)}),
+        ('label', {'text': "Wahoo Folder (Dropbox):"},
+         {'row': 5, 'column': 0, 'columnspan': 3, 'sticky': tk.W, 'pady': (5, 2)}),
+        ('label', {'text': "Example: C:\\Users\\YourName\\Dropbox\\Apps\\WahooFitness", 'font': ('Arial', 8), 'foreground': 'gray'},
+         {'row': 7, 'column': 0, 'columnspan': 3, 'sticky': tk.W}),
+        ('label', {'text': "MyWhoosh Folder:"},
+         {'row': 8, 'column': 0, 'columnspan': 3, 'sticky': tk.W, 'pady': (10, 2)}),
+        ('label', {'text': "Example: C:\\Users\\YourName\\AppData\\Local\\...\\MyWhoosh\\Content\\Data", 'font': ('Arial', 8), 'foreground': 'gray'},
+         {'row': 10, 'column': 0, 'columnspan': 3, 'sticky': tk.W}),
+        ('separator', {'orient': 'horizontal'}, {'row': 13, 'column': 0, 'columnspan': 3, 'sticky': (tk.W, tk.E), 'pady': 15}),
+        # Auto-Start Settings, with a helpful note
+        ('label', {'text': "⏰ Auto-Start Settings", 'style': 'Header.TLabel'},
+         {'row': 14, 'column': 0, 'columnspan': 3, 'sticky': tk.W, 'pady': (5, 5)}),
+        ('label', {'text': "💡 Tip: Enable both 'Start with Windows' AND 'Start Auto-Sync' for automatic background uploads",
+                   'font': ('Arial', 8, 'italic'), 'foreground': '#0066cc', 'wraplength': 600},
+         {'row': 15, 'column': 0, 'columnspan': 3, 'sticky': tk.W, 'pady': (0, 5)}),
+        ('separator', {'orient': 'horizontal'}, {'row': 18, 'column': 0, 'columnspan': 3, 'sticky': (tk.W, tk.E), 'pady': 10}),
+        # Actions
+        ('label', {'text': "▶️ Actions", 'style': 'Header.TLabel'},
+         {'row': 19, 'column': 0, 'columnspan': 3, 'sticky': tk.W, 'pady': (10, 5)}),
+    )
+    
     def __init__(self, root):
         self.root = root
         self.root.title(f"Garmin Connect Uploader v{VERSION}")
         # Get DPI scaling factor
         scaling = self.root.tk.call('tk', 'scaling')
         self.scaling = scaling  # Store for use in dialog windows
+        self._geometries = {}  # Scaled dialog geometry strings by base size
         
         # Base dimensions at 96 DPI (1.0 scaling)
         base_width = 600
@@ -184,29 +562,43 @@ class ConnectUploaderGUI:
         self.root.resizable(True, True)
         
         # Store for later use
+        self._width = width
         self._max_height = max_height
         
-        # Set modern styling
-        style = ttk.Style()
-        style.theme_use('clam')  # More modern theme
-        
-        # Configure colors
-        style.configure('TLabel', background='#f0f0f0')
-        style.configure('TFrame', background='#f0f0f0')
-        style.configure('TButton', padding=6)
-        style.configure('Header.TLabel', font=('Arial', 11, 'bold'), background='#f0f0f0')
-        style.configure('Title.TLabel', font=('Arial', 16, 'bold'), background='#f0f0f0', foreground='#2c3e50')
+        # Set modern styling ('clam' theme + colors) in a single Tcl evaluation
+        self.root.tk.eval(
+            "ttk::style theme use clam\n"
+            "ttk::style configure TLabel -background #f0f0f0\n"
+            "ttk::style configure TFrame -background #f0f0f0\n"
+            "ttk::style configure TButton -padding 6\n"
+            "ttk::style configure Header.TLabel -font {Arial 11 bold} -background #f0f0f0\n"
+            "ttk::style configure Title.TLabel -font {Arial 16 bold} -background #f0f0f0 -foreground #2c3e50"
+        )
         
         # Set window background
         self.root.configure(bg='#f0f0f0')
         
-        # Set window icon
+        # Set window icon (file read and decoded once, also used for the title and tray logos)
+        try:
+            with open(LOGO_PATH, 'rb') as f:
+                self._logo_bytes = f.read()
+        except OSError:
+            self._logo_bytes = None
+        self._logo_pil = None
+        # Every live Tk image, by (path, size); Tk drops an image shown in a label once
+        # Python no longer references it, so this is the one place those references live
+        self._images = {}
         try:
-            if os.path.exists(LOGO_PATH):
-                logo_img = Image.open(LOGO_PATH)
-                logo_photo = ImageTk.PhotoImage(logo_img)
+            if self._logo_bytes:
+                self._logo_pil = Image.open(io.BytesIO(self._logo_bytes))
+                self._logo_pil.load()
+                try:
+                    # Tk 8.6 decodes PNG itself, which skips copying the full-size logo in from PIL
+                    logo_photo = tk.PhotoImage(data=base64.b64encode(self._logo_bytes))
+                except tk.TclError:
+                    logo_photo = ImageTk.PhotoImage(self._logo_pil)
                 self.root.iconphoto(True, logo_photo)
-                self.logo_image = logo_photo  # Keep reference
+                self._images[(LOGO_PATH, None)] = logo_photo  # Full-size window icon
         except Exception as e:
             print(f"Could not load logo: {e}")
         
@@ -215,12 +607,33 @@ class ConnectUploaderGUI:
         
         # Monitoring state
         self.is_monitoring = False
-        self.monitor_thread = None
+        self.monitor_thread = None  # Worker running the current sync (auto-sync tick, Sync Now or tray)
+        self._monitor_after_id = None  # Pending root.after for the next auto-sync tick
+        self._monitor_run = 0  # Bumped per start/stop so a finishing tick from an old run doesn't reschedule
+        self._quit_event = threading.Event()  # Set by quit_app; wakes worker threads waiting out a delay
+        self._upload_cancel = threading.Event()  # The current run's; set on stop/quit so its queued uploads are skipped
+        self._observer = None  # Watchdog observer for the sync folders while auto-sync runs
+        self._fit_event_pending = False  # A .fit file changed while a sync was running
+        self._idle_runs = 0  # Auto-sync runs in a row that uploaded nothing
         self.garmin_client = None
         self.tray_icon = None
+        self._tray_thread = None  # Runs tray_icon; recreated if it has died
+        self._tray_available = None  # False once pystray failed to import
         self.check_interval = 300  # Default 5 minutes
         self.settings_changed = False  # Track if settings have been modified
+        self._settings_changed_after_id = None  # Pending debounced edit notification
+        self._resize_after = None  # Pending debounced scroll region update
+        self._help_windows = {}  # Help Toplevels by name, hidden instead of destroyed on close
+        self._loading_settings = False  # True while load_settings fills the fields
         self._upload_log_day = None  # Track day marker for uploads log
+        self._pending_status = None  # Latest (text, color) waiting for _flush_status
+        self._status_lock = threading.Lock()
+        self._shown_status = None  # (text, color) currently on the status label
+        self._executor = ThreadPoolExecutor(max_workers=2)  # Blocking network calls off the Tk thread
+        self._validate_future = None  # Pending credential validation
+        self._ps_proc = None  # Long-lived PowerShell used when pywin32 is unavailable
+        self._wsh_local = threading.local()  # WScript.Shell dispatch, one per thread (COM apartments)
+        self._ps_lock = threading.Lock()
         
         self.create_widgets()
         self.load_settings()
@@ -234,28 +647,47 @@ class ConnectUploaderGUI:
         self.session_dir = os.path.join(os.path.expanduser("~"), "AppData", "Local", "GarminUploader", "session")
         os.makedirs(self.session_dir, exist_ok=True)
             
-        # Try to login with session first
+        # Try to login with session first (network call, so once the main loop runs and off the Tk thread)
         self.garmin_client = None
-        self.try_session_login()
+        self.root.after_idle(self._start_session_login)
         
-    def try_session_login(self):
+    def _start_session_login(self):
+        """Read the credentials on the Tk thread and resume the saved session in the background"""
+        email = self.garmin_email.get() if self.garmin_email else self.config.get('garmin_email', '')
+        password = self.garmin_password.get() if self.garmin_password else self.config.get('garmin_password', '')
+        self._executor.submit(self.try_session_login, email, password)
+        
+    def try_session_login(self, email=None, password=None):
         """Try to login using saved session tokens"""
         try:
-            email = self.garmin_email.get() if self.garmin_email else self.config.get('garmin_email', '')
-            password = self.garmin_password.get() if self.garmin_password else self.config.get('garmin_password', '')
+            if email is None:
+                email = self.garmin_email.get() if self.garmin_email else self.config.get('garmin_email', '')
+            if password is None:
+                password = self.garmin_password.get() if self.garmin_password else self.config.get('garmin_password', '')
                 
             if not email or not password:
                 return False
                 
-            # Create session directory specific to this user
-            user_session_dir = os.path.join(self.session_dir, email.replace('@', '_').replace('.', '_'))
-                
-            # Check if session files exist
-            user_session_dir = os.path.join(self.session_dir, email.replace('@', '_').replace('.', '_'))
-            session_files = []
-            if os.path.exists(user_session_dir):
-                session_files = [f for f in os.listdir(user_session_dir) if os.path.isfile(os.path.join(user_session_dir, f))]
-            if session_files:
+            # Check if session files exist (one directory read; entry types come with it)
+            user_session_dir = self._user_session_dir(email)
+            try:
+                with os.scandir(user_session_dir) as entries:
+                    has_session_files = any(entry.is_file() for entry in entries)
+            except OSError:
+                has_session_files = False  # No saved session yet
+            if has_session_files:
+                # garminconnect (requests, garth, ...) is slow to import, so load it on first use
+                from garminconnect import Garmin
+                # Resume the OAuth tokens saved by the last credential login (skips the SSO flow)
+                try:
+                    client = Garmin(email, password)
+                    client.login(user_session_dir)
+                    self.garmin_client = client
+                    logger.info("Successfully logged in using saved session tokens")
+                    self.update_status("Logged in using saved session", "green")
+                    return True
+                except Exception as e:
+                    logger.info(f"Saved session tokens not usable ({e}), trying session directory")
                 # Try to create client with session_dir if supported
                 try:
                     self.garmin_client = Garmin(email, password, session_dir=user_session_dir)
@@ -279,6 +711,19 @@ class ConnectUploaderGUI:
             
         return False
         
+    def _user_session_dir(self, email):
+        """Per-account directory for saved Garmin session tokens"""
+        return os.path.join(self.session_dir, email.replace('@', '_').replace('.', '_'))
+    
+    def _save_session_tokens(self, user_session_dir):
+        """Save the client's OAuth tokens so the next start can skip the SSO login"""
+        try:
+            os.makedirs(user_session_dir, exist_ok=True)
+            self.garmin_client.garth.dump(user_session_dir)
+            logger.info("Saved Garmin session tokens")
+        except Exception as e:
+            logger.warning(f"Could not save Garmin session tokens: {str(e)}")
+    
     def create_widgets(self):
         # Create canvas with scrollbar for content
         canvas = tk.Canvas(self.root, bg='#f0f0f0', highlightthickness=0)
@@ -307,20 +752,31 @@ class ConnectUploaderGUI:
             canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
             return "break"
         
-        # Bind the wheel only when the mouse enters the canvas area
-        canvas.bind("<Enter>", lambda _: canvas.bind_all("<MouseWheel>", on_mousewheel))
-        canvas.bind("<Leave>", lambda _: canvas.unbind_all("<MouseWheel>"))
+        # Bind the wheel only while the mouse is over the canvas area
+        def bind_wheel(_):
+            canvas.bind_all("<MouseWheel>", on_mousewheel)
+            # Add Linux support (optional but good practice)
+            canvas.bind_all("<Button-4>", lambda e: canvas.yview_scroll(-1, "units"))
+            canvas.bind_all("<Button-5>", lambda e: canvas.yview_scroll(1, "units"))
         
-        # Add Linux support (optional but good practice)
-        canvas.bind("<Enter>", lambda _: canvas.bind_all("<Button-4>", lambda e: canvas.yview_scroll(-1, "units")), add="+")
-        canvas.bind("<Enter>", lambda _: canvas.bind_all("<Button-5>", lambda e: canvas.yview_scroll(1, "units")), add="+")
-        canvas.bind("<Leave>", lambda _: canvas.unbind_all("<Button-4>"), add="+")
-        canvas.bind("<Leave>", lambda _: canvas.unbind_all("<Button-5>"), add="+")
+        def unbind_wheel(event):
+            # Moving onto the settings frame (a child window) also fires <Leave>; keep the wheel then
+            try:
+                widget = canvas.winfo_containing(event.x_root, event.y_root)
+            except (KeyError, tk.TclError):
+                widget = None
+            if widget is not None and str(widget).startswith(str(canvas)):
+                return
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                canvas.unbind_all(sequence)
+        
+        canvas.bind("<Enter>", bind_wheel)
+        canvas.bind("<Leave>", unbind_wheel)
         
         # Update scroll region and make frame fill canvas width
-        def on_frame_configure(event):
+        def apply_scrollregion():
+            self._resize_after = None
             # Only enable scrolling when content exceeds canvas size
-            canvas.update_idletasks()  # Ensure sizes are calculated
             frame_height = main_frame.winfo_reqheight()
             canvas_height = canvas.winfo_height()
             
@@ -331,27 +787,20 @@ class ConnectUploaderGUI:
                 # Content fits, disable scrolling
                 canvas.configure(scrollregion=(0, 0, canvas.winfo_width(), canvas_height))
         
-        # Bind mousewheel to canvas
-        def on_mousewheel(event):
-            # Scroll the canvas regardless of content size
-            # Use the event.delta to determine scroll direction
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-            return "break"  # Prevent propagation
+        def schedule_scrollregion():
+            # A window drag fires dozens of <Configure> events; update once it pauses
+            if self._resize_after:
+                self.root.after_cancel(self._resize_after)
+            self._resize_after = self.root.after(RESIZE_DEBOUNCE_MS, apply_scrollregion)
+        
+        def on_frame_configure(event):
+            schedule_scrollregion()
         
         def on_canvas_configure(event):
             # Make the frame fill the canvas width
             canvas.itemconfig(canvas_frame, width=event.width)
             # Update scroll region when canvas is resized
-            canvas.update_idletasks()  # Ensure sizes are calculated
-            frame_height = main_frame.winfo_reqheight()
-            canvas_height = canvas.winfo_height()
-            
-            if frame_height > canvas_height:
-                # Content exceeds canvas, enable scrolling
-                canvas.configure(scrollregion=canvas.bbox("all"))
-            else:
-                # Content fits, disable scrolling
-                canvas.configure(scrollregion=(0, 0, event.width, canvas_height))
+            schedule_scrollregion()
         
         main_frame.bind("<Configure>", on_frame_configure)
         canvas.bind("<Configure>", on_canvas_configure)
@@ -362,10 +811,7 @@ class ConnectUploaderGUI:
         
         # Load and display logo
         try:
-            logo_img = Image.open(LOGO_PATH)
-            logo_img.thumbnail((45, 45))  # Resize to 45x45
-            self.title_logo = ImageTk.PhotoImage(logo_img)
-            logo_label = ttk.Label(title_frame, image=self.title_logo)
+            logo_label = ttk.Label(title_frame, image=self.get_logo_photo(45))  # Resize to 45x45
             logo_label.pack(side=tk.LEFT, padx=(0, 10))
         except Exception:
             pass  # If logo fails to load, just skip it
@@ -373,8 +819,10 @@ class ConnectUploaderGUI:
         # Title text
         ttk.Label(title_frame, text="Garmin Connect Uploader", style='Title.TLabel').pack(side=tk.LEFT)
         
-        # Garmin Settings
-        ttk.Label(main_frame, text="🔑 Garmin Connect Settings", style='Header.TLabel').grid(row=1, column=0, columnspan=3, sticky=tk.W, pady=(10, 5))
+        # Headers, field labels, hints and separators come from one table; interactive widgets follow
+        widget_types = {'label': ttk.Label, 'separator': ttk.Separator}
+        for kind, options, grid in self._STATIC_LAYOUT:
+            widget_types[kind](main_frame, **options).grid(**grid)
         
         # Quick link to Garmin Connect
         garmin_link = ttk.Label(
@@ -390,43 +838,38 @@ class ConnectUploaderGUI:
             lambda e: webbrowser.open("https://connect.garmin.com")
         )
         
-        ttk.Label(main_frame, text="Email:").grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.garmin_email = ttk.Entry(main_frame, width=35)
+        # One StringVar per settings entry; a single shared trace marks edits
+        self.garmin_email_var = tk.StringVar()
+        self.garmin_password_var = tk.StringVar()
+        self.wahoo_folder_var = tk.StringVar()
+        self.mywhoosh_folder_var = tk.StringVar()
+        for var in (self.garmin_email_var, self.garmin_password_var, self.wahoo_folder_var, self.mywhoosh_folder_var):
+            var.trace_add('write', self.schedule_settings_changed)
+        
+        self.garmin_email = ttk.Entry(main_frame, width=35, textvariable=self.garmin_email_var)
         self.garmin_email.grid(row=2, column=1, sticky=tk.W, pady=5, padx=5)
-        self.garmin_email.bind('<KeyRelease>', lambda e: self.mark_settings_changed())
         
-        ttk.Label(main_frame, text="Password:").grid(row=3, column=0, sticky=tk.W, pady=5)
-        self.garmin_password = ttk.Entry(main_frame, show="*", width=35)
+        self.garmin_password = ttk.Entry(main_frame, show="*", width=35, textvariable=self.garmin_password_var)
         self.garmin_password.grid(row=3, column=1, sticky=tk.W, pady=5, padx=5)
-        self.garmin_password.bind('<KeyRelease>', lambda e: self.mark_settings_changed())
-        
-        # Folder Settings
-        ttk.Label(main_frame, text="📁 Folder Settings", style='Header.TLabel').grid(row=4, column=0, columnspan=3, sticky=tk.W, pady=(20, 5))
         
         # Wahoo Folder
-        ttk.Label(main_frame, text="Wahoo Folder (Dropbox):").grid(row=5, column=0, columnspan=3, sticky=tk.W, pady=(5, 2))
         wahoo_row = ttk.Frame(main_frame)
         wahoo_row.grid(row=6, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 2))
-        self.wahoo_folder = ttk.Entry(wahoo_row)
+        self.wahoo_folder = ttk.Entry(wahoo_row, textvariable=self.wahoo_folder_var)
         self.wahoo_folder.pack(side='left', fill='x', expand=True, padx=(0, 5))
         ttk.Button(wahoo_row, text="Browse", command=lambda: self.browse_folder(self.wahoo_folder)).pack(side='left', padx=(0, 3))
         help_btn = ttk.Button(wahoo_row, text="?", command=self.show_wahoo_help, width=2)
         help_btn.pack(side='left')
         
-        ttk.Label(main_frame, text="Example: C:\\Users\\YourName\\Dropbox\\Apps\\WahooFitness", font=('Arial', 8), foreground='gray').grid(row=7, column=0, columnspan=3, sticky=tk.W)
-        
         # MyWhoosh Folder
-        ttk.Label(main_frame, text="MyWhoosh Folder:").grid(row=8, column=0, columnspan=3, sticky=tk.W, pady=(10, 2))
         mywhoosh_row = ttk.Frame(main_frame)
         mywhoosh_row.grid(row=9, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 2))
-        self.mywhoosh_folder = ttk.Entry(mywhoosh_row)
+        self.mywhoosh_folder = ttk.Entry(mywhoosh_row, textvariable=self.mywhoosh_folder_var)
         self.mywhoosh_folder.pack(side='left', fill='x', expand=True, padx=(0, 5))
         ttk.Button(mywhoosh_row, text="Browse", command=lambda: self.browse_folder(self.mywhoosh_folder)).pack(side='left', padx=(0, 3))
         help_btn2 = ttk.Button(mywhoosh_row, text="?", command=self.show_mywhoosh_help, width=2)
         help_btn2.pack(side='left')
         
-        ttk.Label(main_frame, text="Example: C:\\Users\\YourName\\AppData\\Local\\...\\MyWhoosh\\Content\\Data", font=('Arial', 8), foreground='gray').grid(row=10, column=0, columnspan=3, sticky=tk.W)
-        
         # MyWhoosh warning
         warning_frame = ttk.Frame(main_frame)
         warning_frame.grid(row=11, column=0, columnspan=3, sticky=tk.W, pady=(10, 0))
@@ -458,16 +901,6 @@ class ConnectUploaderGUI:
         readme_link.pack(anchor='center')
         readme_link.bind("<Button-1>", lambda e: webbrowser.open("https://github.com/Inc21/Wahoo-and-MyWhoosh-to-Garmin-Conect-Auto-Uploader#%EF%B8%8F-important-sync-behavior"))
         
-        # Separator
-        ttk.Separator(main_frame, orient='horizontal').grid(row=13, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=15)
-        
-        # Auto-Start Settings
-        ttk.Label(main_frame, text="⏰ Auto-Start Settings", style='Header.TLabel').grid(row=14, column=0, columnspan=3, sticky=tk.W, pady=(5, 5))
-        
-        # Helpful note
-        note_text = "💡 Tip: Enable both 'Start with Windows' AND 'Start Auto-Sync' for automatic background uploads"
-        ttk.Label(main_frame, text=note_text, font=('Arial', 8, 'italic'), foreground='#0066cc', wraplength=600).grid(row=15, column=0, columnspan=3, sticky=tk.W, pady=(0, 5))
-        
         # Start with Windows checkbox
         self.start_with_windows = tk.BooleanVar()
         ttk.Checkbutton(main_frame, text="Start with Windows (run in background at startup)", variable=self.start_with_windows, command=self.toggle_autostart).grid(row=16, column=0, columnspan=3, sticky=tk.W, pady=5)
@@ -482,17 +915,12 @@ class ConnectUploaderGUI:
         interval_spinbox.pack(side=tk.LEFT)
         ttk.Label(interval_frame, text="minutes").pack(side=tk.LEFT, padx=(5, 0))
         
-        # Separator
-        ttk.Separator(main_frame, orient='horizontal').grid(row=18, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=10)
-        
-        # Actions
-        ttk.Label(main_frame, text="▶️ Actions", style='Header.TLabel').grid(row=19, column=0, columnspan=3, sticky=tk.W, pady=(10, 5))
-        
         # Action buttons in a frame, centered with equal width
         btn_frame = ttk.Frame(main_frame)
         btn_frame.grid(row=20, column=0, columnspan=3, pady=5)
         
-        ttk.Button(btn_frame, text="Save Settings", command=self.save_settings).pack(side='left', padx=3)
+        self.save_button = ttk.Button(btn_frame, text="Save Settings", command=self.save_settings)
+        self.save_button.pack(side='left', padx=3)
         self.sync_button = ttk.Button(btn_frame, text="Sync Now", command=self.sync_now)
         self.sync_button.pack(side='left', padx=3)
         self.monitor_button = ttk.Button(btn_frame, text="Start Auto-Sync", command=self.toggle_monitoring)
@@ -524,16 +952,52 @@ class ConnectUploaderGUI:
         log_link.grid(row=24, column=0, columnspan=3, pady=(5, 10))
         log_link.bind("<Button-1>", lambda e: self.open_log_file())
         
-        # Auto-size window to content after UI is built
-        self.root.update_idletasks()  # Force layout calculation
+        # Auto-size window to content once Tk has laid out the UI
+        # (on idle, so there is no forced layout pass and a single resize)
+        self.root.after_idle(self._fit_to_content, main_frame, canvas)
+    
+    def scaled_geometry(self, base_width, base_height):
+        """Return the DPI-scaled 'WxH' geometry for a dialog sized at 96 DPI, computed once per size"""
+        geometry = self._geometries.get((base_width, base_height))
+        if geometry is None:
+            factor = self.scaling / 1.33
+            geometry = self._geometries[(base_width, base_height)] = f"{int(base_width * factor)}x{int(base_height * factor)}"
+        return geometry
+    
+    def get_logo_photo(self, size):
+        """Return the app logo as a size x size PhotoImage, resized once and cached"""
+        photo = self._images.get((LOGO_PATH, size))
+        if photo is None:
+            logo_img = self._logo_pil.copy()
+            logo_img.thumbnail((size, size))
+            photo = self._images[(LOGO_PATH, size)] = ImageTk.PhotoImage(logo_img)
+        return photo
+    
+    def get_image_photo(self, path, size):
+        """
+        Return an image file thumbnailed to fit size x size as a PhotoImage, decoded once and kept
+        in _images. Returns None if the file is missing or unreadable (also remembered, so
+        reopening a dialog doesn't look for it again).
+        """
+        key = (path, size)
+        if key not in self._images:
+            try:
+                with Image.open(path) as img:
+                    img.draft('RGB', (size, size))  # JPEG decodes straight at a reduced scale; no-op otherwise
+                    img.thumbnail((size, size), BILINEAR)
+                    self._images[key] = ImageTk.PhotoImage(img)
+            except OSError:
+                self._images[key] = None
+        return self._images[key]
+    
+    def _fit_to_content(self, main_frame, canvas):
+        """Size the window to the laid-out content, capped at the max height"""
         required_height = main_frame.winfo_reqheight() + 40  # Add padding
         
         # Use required height but cap at max_height to prevent too-tall windows
         actual_height = min(required_height, self._max_height)
         
-        # Get current geometry width
-        current_width = self.root.winfo_width()
-        self.root.geometry(f"{current_width}x{actual_height}")
+        self.root.geometry(f"{self._width}x{actual_height}")
         
         # Preserve scroll position after window resize to prevent jumping to top
         try:
@@ -549,16 +1013,25 @@ class ConnectUploaderGUI:
             # If canvas is not ready, default to top
             canvas.yview_moveto(0)  # Canvas might not be ready yet
         
+    def _reuse_help_window(self, name):
+        """Show the help window built earlier, if any; returns True when it was reused"""
+        help_window = self._help_windows.get(name)
+        if help_window is None or not help_window.winfo_exists():
+            return False
+        help_window.deiconify()
+        help_window.lift()
+        return True
+    
     def show_wahoo_help(self):
+        if self._reuse_help_window('wahoo'):
+            return
         # Create a new window with selectable text
-        help_window = tk.Toplevel(self.root)
+        help_window = self._help_windows['wahoo'] = tk.Toplevel(self.root)
         help_window.title("Wahoo Setup Instructions")
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)  # Kept for the next open
         
         # Apply DPI scaling
-        base_width, base_height = 550, 500
-        width = int(base_width * (self.scaling / 1.33))
-        height = int(base_height * (self.scaling / 1.33))
-        help_window.geometry(f"{width}x{height}")
+        help_window.geometry(self.scaled_geometry(550, 500))
         help_window.resizable(False, False)
         
         # Title
@@ -577,48 +1050,23 @@ class ConnectUploaderGUI:
         text_area = scrolledtext.ScrolledText(help_window, wrap=tk.WORD, width=65, height=20, font=('Arial', 9))
         text_area.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
         
-        help_text = """1. Create a Dropbox account (free):
-   → Go to dropbox.com and sign up
-
-2. Connect Wahoo to Dropbox:
-   → Open Wahoo ELEMNT app on your phone
-   → Go to Settings → Cloud Services
-   → Enable Dropbox and authorize
-
-3. Install Dropbox on your PC:
-   → Download from dropbox.com/install
-   → Sign in with your account
-   → Let it sync
-
-4. Find the Wahoo folder:
-   → Open File Explorer
-   → Navigate to:
-   
-   C:\\Users\\YourName\\Dropbox\\Apps\\WahooFitness
-   
-   → Copy this path and paste it in the Wahoo Folder field
-
-Note: The app will automatically create an 'uploaded' subfolder to move processed .fit files there.
-
-You can select and copy text from this window!"""
-        
-        text_area.insert(1.0, help_text)
-        text_area.config(state='normal')  # Keep it editable so users can select/copy
+        text_area.insert(1.0, WAHOO_HELP_TEXT)
+        text_area.config(state='disabled')  # Read-only: the cached window is reused, edits would stick (select/copy still work)
         
         # Close button
-        close_btn = ttk.Button(help_window, text="Close", command=help_window.destroy)
+        close_btn = ttk.Button(help_window, text="Close", command=help_window.withdraw)
         close_btn.pack(pady=10)
     
     def show_mywhoosh_help(self):
+        if self._reuse_help_window('mywhoosh'):
+            return
         # Create a new window with selectable text
-        help_window = tk.Toplevel(self.root)
+        help_window = self._help_windows['mywhoosh'] = tk.Toplevel(self.root)
         help_window.title("MyWhoosh Folder Instructions")
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)  # Kept for the next open
         
         # Apply DPI scaling
-        base_width, base_height = 600, 500
-        width = int(base_width * (self.scaling / 1.33))
-        height = int(base_height * (self.scaling / 1.33))
-        help_window.geometry(f"{width}x{height}")
+        help_window.geometry(self.scaled_geometry(600, 500))
         help_window.resizable(False, False)
         
         # Title
@@ -629,43 +1077,11 @@ You can select and copy text from this window!"""
         text_area = scrolledtext.ScrolledText(help_window, wrap=tk.WORD, width=70, height=24, font=('Arial', 9))
         text_area.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
         
-        help_text = """MyWhoosh only keeps the LAST activity in its cache folder.
-This folder is hidden deep in Windows AppData.
-
-How to find it:
-
-1. Open File Explorer
-
-2. In the address bar, paste this and press Enter:
-
-   %localappdata%\\Packages
-
-3. Look for a folder starting with:
-
-   MyWhooshTechnologyService.644173E064ED2
-   
-   Full example:
-   MyWhooshTechnologyService.644173E064ED2_eps1123pz0kt0
-
-4. Open that folder, then navigate to:
-
-   LocalCache\\Local\\MyWhoosh\\Content\\Data
-
-5. Full path example (copy this format):
-
-   C:\\Users\\YourName\\AppData\\Local\\Packages\\MyWhooshTechnologyService.644173E064ED2_eps1123pz0kt0\\LocalCache\\Local\\MyWhoosh\\Content\\Data
-
-6. Copy YOUR path and paste it in the MyWhoosh Folder field
-
-Note: MyWhoosh typically only keeps the most recent activity file (usually MyNewActivity-5.5.1.fit or similar) in this folder. The app will process ALL .fit files it finds there.
-
-You can select and copy text from this window!"""
-        
-        text_area.insert(1.0, help_text)
-        text_area.config(state='normal')  # Keep it editable so users can select/copy
+        text_area.insert(1.0, MYWHOOSH_HELP_TEXT)
+        text_area.config(state='disabled')  # Read-only: the cached window is reused, edits would stick (select/copy still work)
         
         # Close button
-        close_btn = ttk.Button(help_window, text="Close", command=help_window.destroy)
+        close_btn = ttk.Button(help_window, text="Close", command=help_window.withdraw)
         close_btn.pack(pady=10)
     
     def browse_folder(self, entry_widget):
@@ -675,12 +1091,15 @@ You can select and copy text from this window!"""
             entry_widget.insert(0, folder)
     
     def load_config(self):
-        if os.path.exists(CONFIG_FILE):
-            try:
-                with open(CONFIG_FILE, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
+        self._config_bytes = None  # What is on disk, so save_config can skip identical rewrites
+        try:
+            with open(CONFIG_FILE, 'rb') as f:
+                data = f.read()
+            config = json_loads(data)
+            self._config_bytes = data
+            return config
+        except:
+            pass  # Missing or unreadable config - use defaults
         return {
             'garmin_email': '',
             'garmin_password': '',
@@ -691,29 +1110,51 @@ You can select and copy text from this window!"""
         }
     
     def save_config(self):
+        password = self.garmin_password.get()
+        stored_password = self.config.get('garmin_password', '')
+        if (stored_password and decrypt_password(stored_password) == password
+                and (AESGCM is None or stored_password.startswith(AES_PASSWORD_PREFIX))):
+            # Unchanged: keep the stored ciphertext (AES-GCM uses a fresh nonce on every encrypt)
+            encrypted_password = stored_password
+        else:
+            encrypted_password = encrypt_password(password)  # Encrypt password
         config = {
             'garmin_email': self.garmin_email.get(),
-            'garmin_password': encrypt_password(self.garmin_password.get()),  # Encrypt password
+            'garmin_password': encrypted_password,
             'wahoo_folder': self.wahoo_folder.get(),
             'mywhoosh_folder': self.mywhoosh_folder.get(),
             'start_with_windows': self.start_with_windows.get(),
             'check_interval': self.interval_var.get()
         }
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        data = json_dumps(config)
+        if data == self._config_bytes:
+            logger.info("Configuration unchanged - not rewritten")
+            return config
+        # Write to a temp file and swap it in, so an interrupted save never leaves a truncated config
+        tmp_file = CONFIG_FILE + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, CONFIG_FILE)
+        self._config_bytes = data
         logger.info("Configuration saved (password encrypted)")
         return config
     
     def load_last_sync_from_log(self):
         """Load last sync and upload info from log file on startup"""
-        if not os.path.exists(LOG_FILE):
-            return
-        
         try:
             # Read last 200 lines of log file to ensure we catch everything
-            with open(LOG_FILE, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                last_lines = lines[-200:] if len(lines) > 200 else lines
+            # (only the tail of the file is read, it can grow to MAX_LOG_SIZE_MB)
+            try:
+                f = open(LOG_FILE, 'rb')
+            except OSError:
+                return  # No log yet
+            with f:
+                f.seek(0, os.SEEK_END)
+                start = max(0, f.tell() - LOG_TAIL_BYTES)
+                f.seek(start)
+                if start:
+                    f.readline()  # Skip the line cut in half by the seek
+                last_lines = [line.decode('utf-8', errors='replace') for line in deque(f, maxlen=200)]
             
             # Search for last sync completion
             last_sync_time = None
@@ -726,19 +1167,17 @@ You can select and copy text from this window!"""
                     if " - INFO - " in line:
                         timestamp_str = line.split(" - INFO - ")[0]
                         try:
-                            # Parse timestamp: 2025-12-29 01:26:34,358
-                            dt = datetime.datetime.strptime(timestamp_str.strip(), "%Y-%m-%d %H:%M:%S,%f")
-                            last_sync_time = dt.strftime("%Y-%m-%d %H:%M:%S")
-                        except:
+                            # Timestamp: 2025-12-29 01:26:34,358
+                            last_sync_time = log_timestamp(timestamp_str.strip())
+                        except ValueError:
                             pass
                         
                         # Extract upload count
-                        if "uploaded" in line.lower():
-                            import re
-                            match = re.search(r'(\d+) activit', line)
+                        if "uploaded" in line.lower() and last_sync_time:
+                            match = ACTIVITY_COUNT_RE.search(line)
                             if match:
                                 count = match.group(1)
-                                upload_time = dt.strftime("%Y-%m-%d %H:%M")
+                                upload_time = last_sync_time[:16]
                                 if int(count) > 0:
                                     last_upload_info = f"Last upload: {upload_time} - {count} file(s) uploaded"
                                 else:
@@ -757,8 +1196,7 @@ You can select and copy text from this window!"""
                             filename = parts[1].strip()
                             try:
                                 timestamp_str = line.split(" - INFO - ")[0]
-                                dt = datetime.datetime.strptime(timestamp_str.strip(), "%Y-%m-%d %H:%M:%S,%f")
-                                upload_time = dt.strftime("%Y-%m-%d %H:%M")
+                                upload_time = log_timestamp(timestamp_str.strip())[:16]
                                 last_upload_info = f"Last upload: {upload_time} - Latest: {filename}"
                             except:
                                 last_upload_info = f"Last upload: Latest: {filename}"
@@ -778,57 +1216,100 @@ You can select and copy text from this window!"""
             log_info(f"Could not load last sync info from log: {str(e)}")
     
     def load_settings(self):
-        self.garmin_email.insert(0, self.config.get('garmin_email', ''))
-        # Decrypt password when loading
-        encrypted_password = self.config.get('garmin_password', '')
-        decrypted_password = decrypt_password(encrypted_password)
-        self.garmin_password.insert(0, decrypted_password)
-        self.wahoo_folder.insert(0, self.config.get('wahoo_folder', ''))
-        self.mywhoosh_folder.insert(0, self.config.get('mywhoosh_folder', ''))
-        self.start_with_windows.set(self.config.get('start_with_windows', False))
-        self.interval_var.set(self.config.get('check_interval', 5))
+        # Fill every field through its variable in one pass; the traces ignore these writes
+        self._loading_settings = True
+        try:
+            for var, key, default in (
+                (self.garmin_email_var, 'garmin_email', ''),
+                (self.wahoo_folder_var, 'wahoo_folder', ''),
+                (self.mywhoosh_folder_var, 'mywhoosh_folder', ''),
+                (self.start_with_windows, 'start_with_windows', False),
+                (self.interval_var, 'check_interval', 5),
+            ):
+                var.set(self.config.get(key, default))
+            # Decrypt password when loading
+            self.garmin_password_var.set(decrypt_password(self.config.get('garmin_password', '')))
+        finally:
+            self._loading_settings = False
         self.check_interval = self.interval_var.get() * 60  # Convert to seconds
     
-    def save_settings(self):
+    def save_settings(self, on_saved=None):
+        """Save the settings; on_saved (if given) runs on the Tk thread once they are saved"""
+        def save():
+            self._save_validated_settings()
+            if on_saved:
+                on_saved()
+        
         # Validate Garmin credentials if they've been entered
         if self.garmin_email.get() and self.garmin_password.get():
-            if not self.validate_garmin_credentials():
-                return  # Don't save if validation fails
+            # Settings are saved once validation succeeds (not saved if it fails)
+            self.validate_garmin_credentials(on_success=save)
+            return
         
+        save()
+    
+    def _save_validated_settings(self):
         self.config = self.save_config()
         self.check_interval = self.interval_var.get() * 60  # Update interval in seconds
+        self.cancel_settings_changed()
         self.settings_changed = False  # Reset flag after saving
         log_success("Settings saved successfully")
         messagebox.showinfo("Settings Saved", "Your settings have been saved successfully!")
         self.update_status("Settings saved", "green")
     
-    def validate_garmin_credentials(self):
-        """Test Garmin credentials to ensure they're valid"""
+    def validate_garmin_credentials(self, on_success=None):
+        """Test Garmin credentials in the background; on_success runs on the Tk thread if valid"""
         email = self.garmin_email.get()
         password = self.garmin_password.get()
         
         if not email or not password:
-            return True  # Skip validation if empty
+            # Skip validation if empty
+            if on_success:
+                on_success()
+            return
+        
+        if self._validate_future and not self._validate_future.done():
+            return  # A validation is already running
         
         # Show progress
         self.update_status("Validating Garmin credentials...", "orange")
         logger.info(f"Validating Garmin credentials for: {email}")
         
+        # Test login in background thread to avoid blocking UI
+        # Create temporary session directory for validation
+        temp_session_dir = os.path.join(tempfile.gettempdir(), f"garmin_validate_{email.replace('@', '_').replace('.', '_')}")
+        self._validate_future = self._executor.submit(
+            self._test_garmin_login, email, password, temp_session_dir, self._user_session_dir(email))
+        self.save_button.config(state='disabled')  # Re-enabled once the check finishes
+        self.root.after(100, self._poll_validate_credentials, self._validate_future, on_success)
+    
+    @staticmethod
+    def _test_garmin_login(email, password, session_dir, token_dir):
+        """Log in with a throwaway client (runs on a worker thread) and keep its tokens in token_dir"""
+        from garminconnect import Garmin
+        # Try to create client with session_dir if supported
         try:
-            # Test login in background thread to avoid blocking UI
-            # Create temporary session directory for validation
-            temp_session_dir = os.path.join(tempfile.gettempdir(), f"garmin_validate_{email.replace('@', '_').replace('.', '_')}")
-            # Try to create client with session_dir if supported
-            try:
-                test_client = Garmin(email, password, session_dir=temp_session_dir)
-            except TypeError:
-                # session_dir not supported, create without it
-                test_client = Garmin(email, password)
-            test_client.login()
-            log_success("Garmin credentials validated successfully")
-            messagebox.showinfo("Credentials Valid", "✅ Garmin credentials are valid!")
-            self.update_status("Garmin credentials validated", "green")
-            return True
+            test_client = Garmin(email, password, session_dir=session_dir)
+        except TypeError:
+            # session_dir not supported, create without it
+            test_client = Garmin(email, password)
+        test_client.login()
+        # The next sync can resume these tokens instead of repeating the SSO login
+        try:
+            os.makedirs(token_dir, exist_ok=True)
+            test_client.garth.dump(token_dir)
+        except Exception as e:
+            logger.warning(f"Could not save Garmin session tokens: {str(e)}")
+    
+    def _poll_validate_credentials(self, future, on_success):
+        """Report the credential check once the worker finishes"""
+        if not future.done():
+            self.root.after(100, self._poll_validate_credentials, future, on_success)
+            return
+        
+        self.save_button.config(state='normal')
+        try:
+            future.result()
         except Exception as e:
             logger.error(f"Garmin credential validation failed: {str(e)}")
             messagebox.showerror(
@@ -836,12 +1317,39 @@ You can select and copy text from this window!"""
                 f"❌ Could not login to Garmin Connect.\n\nError: {str(e)}\n\nPlease check your email and password."
             )
             self.update_status("Garmin login failed", "red")
-            return False
+            return
+        
+        log_success("Garmin credentials validated successfully")
+        messagebox.showinfo("Credentials Valid", "✅ Garmin credentials are valid!")
+        self.update_status("Garmin credentials validated", "green")
+        if on_success:
+            on_success()
     
     def mark_settings_changed(self):
         """Mark that settings have been modified"""
         self.settings_changed = True
     
+    def schedule_settings_changed(self, *args):
+        """Debounce entry edits so typing marks settings changed once"""
+        if self._loading_settings or self.settings_changed:
+            return  # Filled in by load_settings, or already marked: nothing to schedule
+        if self._settings_changed_after_id:
+            self.root.after_cancel(self._settings_changed_after_id)
+        self._settings_changed_after_id = self.root.after(300, self.flush_settings_changed)
+    
+    def flush_settings_changed(self):
+        """Apply a pending debounced edit notification right away"""
+        if self.cancel_settings_changed():
+            self.mark_settings_changed()
+    
+    def cancel_settings_changed(self):
+        """Drop a pending debounced edit notification; True if one was pending"""
+        if not self._settings_changed_after_id:
+            return False
+        self.root.after_cancel(self._settings_changed_after_id)
+        self._settings_changed_after_id = None
+        return True
+    
     def _maybe_log_upload_day_marker(self):
         """Write a day separator to the uploads log when the day changes"""
         now_day = datetime.datetime.now().strftime("%Y-%m-%d")
@@ -863,84 +1371,155 @@ You can select and copy text from this window!"""
             return os.path.abspath(sys.executable)
         return os.path.abspath(__file__)
 
+    def _get_wsh(self):
+        """Return this thread's cached WScript.Shell COM object"""
+        shell = getattr(self._wsh_local, 'shell', None)
+        if shell is None:
+            import pythoncom
+            import win32com.client
+            # COM must be initialized on each thread that uses it; pythoncom only does that
+            # itself for the thread that first imports it, which may be any thread now
+            pythoncom.CoInitialize()
+            shell = self._wsh_local.shell = win32com.client.Dispatch("WScript.Shell")
+        return shell
+    
     def get_shortcut_target(self, shortcut_path):
         """Get the target path of a Windows shortcut using COM objects"""
-        if win32com:
+        if HAS_WIN32COM:
             try:
-                shell = win32com.client.Dispatch("WScript.Shell")
-                shortcut = shell.CreateShortcut(shortcut_path)
+                shortcut = self._get_wsh().CreateShortcut(shortcut_path)
                 return shortcut.TargetPath
             except Exception:
                 pass
         
-        # Fallback: try using PowerShell in a less obvious way
+        # Fallback: ask the shared PowerShell process
         try:
-            import subprocess
-            ps_command = f'powershell -ExecutionPolicy Bypass -Command "(New-Object -ComObject WScript.Shell).CreateShortcut(\"{shortcut_path}\").TargetPath"'
-            result = subprocess.run(ps_command, capture_output=True, text=True, shell=True)
-            if result.returncode == 0:
-                return result.stdout.strip()
+            ok, output = self._run_powershell(f'$WshShell.CreateShortcut({ps_quote(shortcut_path)}).TargetPath')
+            if ok:
+                return output.strip()
         except Exception:
             pass
         return None
     
+    def _run_powershell(self, command, timeout=10):
+        """
+        Run a one-line command in a persistent PowerShell process and return (ok, output).
+        The process is started on first use so later calls skip the PowerShell startup cost;
+        $WshShell is created once inside it. A command that hangs past `timeout` seconds
+        kills the process, which is restarted on the next call.
+        """
+        with self._ps_lock:
+            if self._ps_proc is None or self._ps_proc.poll() is not None:
+                self._ps_proc = subprocess.Popen(
+                    ['powershell', '-NoProfile', '-NonInteractive', '-ExecutionPolicy', 'Bypass', '-Command', '-'],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                    text=True, encoding='utf-8', errors='replace',
+                    creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+                )
+                # Paths may contain non-ASCII characters, so switch both ends of the pipe to UTF-8
+                # (this line itself is ASCII). Setting InputEncoding drops anything PowerShell has
+                # already buffered from stdin, so wait for its answer before sending more.
+                ok, output = self._ps_exchange(
+                    "[Console]::InputEncoding = [Console]::OutputEncoding = New-Object System.Text.UTF8Encoding $false; "
+                    "$WshShell = New-Object -ComObject WScript.Shell",
+                    timeout
+                )
+                if not ok:
+                    if self._ps_proc:
+                        self._ps_proc.kill()  # Half set up: start afresh next time
+                        self._ps_proc = None
+                    return False, output
+            return self._ps_exchange(command, timeout)
+    
+    def _ps_exchange(self, command, timeout):
+        """Send one command to the PowerShell process and read up to its sentinel (hold _ps_lock)"""
+        proc = self._ps_proc
+        proc.stdin.write(
+            f"try {{ {command}; Write-Output '{PS_SENTINEL} OK' }} "
+            f"catch {{ Write-Output ('{PS_SENTINEL} ERR ' + $_) }}\n"
+        )
+        proc.stdin.flush()
+        watchdog = threading.Timer(timeout, proc.kill)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            lines = []
+            for line in proc.stdout:
+                if line.startswith(PS_SENTINEL):
+                    status = line[len(PS_SENTINEL):].strip()
+                    if status == 'OK':
+                        return True, ''.join(lines)
+                    return False, status[4:]
+                lines.append(line)
+        finally:
+            watchdog.cancel()
+        # PowerShell exited (or was killed) before answering
+        self._ps_proc = None
+        return False, ''.join(lines) or f"PowerShell exited with code {proc.wait()}"
+    
+    def _stop_powershell(self):
+        """Shut down the shared PowerShell process if it was started"""
+        with self._ps_lock:
+            proc, self._ps_proc = self._ps_proc, None
+        if proc and proc.poll() is None:
+            try:
+                proc.stdin.write("exit\n")
+                proc.stdin.flush()
+                proc.wait(timeout=2)
+            except Exception:
+                proc.kill()
+    
     def create_autostart_shortcut(self):
-        """Quietly create the auto-start shortcut without user interaction"""
-        startup_folder = os.path.join(os.getenv('APPDATA'), 'Microsoft', 'Windows', 'Start Menu', 'Programs', 'Startup')
-        shortcut_path = os.path.join(startup_folder, 'GarminUploader.lnk')
-        
+        """Quietly create the auto-start shortcut to the running executable; returns True on success"""
         exe_path = self._get_current_executable()
+        return self._create_autostart_shortcut(exe_path, os.path.dirname(exe_path))
+    
+    def _create_autostart_shortcut(self, target_path, working_dir, arguments='--minimized'):
+        """Write the auto-start shortcut via COM, falling back to PowerShell; returns True on success"""
+        shortcut_path = AUTOSTART_SHORTCUT_PATH
         
-        working_dir = os.path.dirname(exe_path)
-        
-        if win32com:
+        if HAS_WIN32COM:
             try:
                 # Create shortcut using COM objects instead of PowerShell to be more stealthy
-                shell = win32com.client.Dispatch("WScript.Shell")
-                shortcut = shell.CreateShortcut(shortcut_path)
-                shortcut.TargetPath = exe_path
-                shortcut.Arguments = "--minimized"
+                shortcut = self._get_wsh().CreateShortcut(shortcut_path)
+                shortcut.TargetPath = target_path
+                shortcut.Arguments = arguments
                 shortcut.WorkingDirectory = working_dir
                 shortcut.WindowStyle = 7  # Minimized window
                 shortcut.Description = "Garmin Connect Uploader"
                 shortcut.Save()
                 
                 logger.info(f"Auto-start shortcut created: {shortcut_path}")
-                return
+                return True
             except Exception as e:
                 logger.error(f"Failed to create shortcut using COM: {str(e)}")
         
         # Fallback to PowerShell if COM fails
         try:
-            import subprocess
-            ps_command = (
-                f'$WshShell = New-Object -ComObject WScript.Shell; '
-                f'$Shortcut = $WshShell.CreateShortcut("{shortcut_path}"); '
-                f'$Shortcut.TargetPath = "{exe_path}"; '
-                f'$Shortcut.Arguments = "--minimized"; '
-                f'$Shortcut.WorkingDirectory = "{working_dir}"; '
-                f'$Shortcut.WindowStyle = 7; '
-                f'$Shortcut.Description = "Garmin Connect Uploader"; '
-                f'$Shortcut.Save()'
+            ps_command = PS_SHORTCUT_TEMPLATE.format(
+                shortcut=ps_quote(shortcut_path),
+                target=ps_quote(target_path),
+                arguments=ps_quote(arguments),
+                working_dir=ps_quote(working_dir),
             )
-            result = subprocess.run(f'powershell -ExecutionPolicy Bypass -Command "{ps_command}"', 
-                                  shell=True, capture_output=True, text=True)
-            if result.returncode == 0:
+            ok, error = self._run_powershell(ps_command)
+            if ok:
                 logger.info(f"Auto-start shortcut created via PowerShell: {shortcut_path}")
-            else:
-                logger.error(f"PowerShell shortcut creation failed: {result.stderr}")
+                return True
+            logger.error(f"PowerShell shortcut creation failed: {error}")
         except Exception as ps_e:
             logger.error(f"PowerShell method failed to create shortcut: {str(ps_e)}")
+        return False
     
     def toggle_autostart(self):
         """Toggle Windows startup using shortcut"""
-        startup_folder = os.path.join(os.getenv('APPDATA'), 'Microsoft', 'Windows', 'Start Menu', 'Programs', 'Startup')
-        shortcut_path = os.path.join(startup_folder, 'GarminUploader.lnk')
+        shortcut_path = AUTOSTART_SHORTCUT_PATH
         
         if self.start_with_windows.get():
             # Create startup shortcut
             try:
-                self.create_autostart_shortcut()
+                if not self.create_autostart_shortcut():
+                    raise OSError("the shortcut could not be written (see log for details)")
                 messagebox.showinfo("Auto-Start Enabled", "Garmin Uploader will now start automatically when Windows starts!\n\nIt will start minimized to system tray.")
                 self.update_status("Auto-start enabled", "green")
             except Exception as e:
@@ -960,17 +1539,33 @@ You can select and copy text from this window!"""
                 messagebox.showerror("Error", f"Could not disable auto-start: {e}")
     
     def check_old_version_shortcut(self):
+        """Check for old version shortcuts in the background so startup isn't blocked"""
+        autostart_enabled = hasattr(self, 'start_with_windows') and self.start_with_windows.get()
+        # The worker posts dialogs via root.after, which needs the main loop to be running
+        self.root.after_idle(lambda: threading.Thread(
+            target=self._check_old_version_shortcut, args=(autostart_enabled,), daemon=True).start())
+    
+    def _ask_yes_no(self, title, message, timeout=300):
+        """Show a yes/no dialog on the Tk thread and wait for the answer (call from worker threads)"""
+        answer = queue.Queue(maxsize=1)
+        self.root.after(0, lambda: answer.put(messagebox.askyesno(title, message)))
+        try:
+            return answer.get(timeout=timeout)
+        except queue.Empty:
+            logger.warning(f"No answer to '{title}' within {timeout}s, assuming No")
+            return False
+    
+    def _check_old_version_shortcut(self, autostart_enabled):
         """Check for old version shortcuts and quietly update them if needed"""
         try:
-            startup_folder = os.path.join(os.getenv('APPDATA'), 'Microsoft', 'Windows', 'Start Menu', 'Programs', 'Startup')
-            shortcut_path = os.path.join(startup_folder, 'GarminUploader.lnk')
+            shortcut_path = AUTOSTART_SHORTCUT_PATH
                 
             logger.info(f"Checking for auto-start shortcut at: {shortcut_path}")
                 
             # Check if shortcut exists
             if not os.path.exists(shortcut_path):
                 # Check if auto-start is enabled in settings
-                if hasattr(self, 'start_with_windows') and self.start_with_windows.get():
+                if autostart_enabled:
                     logger.info("Auto-start is enabled but shortcut is missing - quietly recreating shortcut")
                     # Quietly recreate the shortcut without user interaction
                     self.create_autostart_shortcut()
@@ -1010,7 +1605,7 @@ You can select and copy text from this window!"""
                     logger.info(f"Version mismatch detected: {old_version} -> {current_version}")
                     
                     # Ask user whether to replace the shortcut
-                    replace = messagebox.askyesno(
+                    replace = self._ask_yes_no(
                         "Update Startup Shortcut",
                         f"A startup shortcut points to the old version:\n\n"
                         f"Current shortcut: {old_version}\n"
@@ -1035,7 +1630,28 @@ You can select and copy text from this window!"""
         except Exception as e:
             logger.warning(f"Error checking old version shortcut: {str(e)}")
     
+    def validate_settings_silent(self):
+        """
+        Check settings without any dialogs, for auto-sync runs on the monitor thread.
+        Returns (ok, warnings); a missing folder is only a warning, its sync is skipped.
+        """
+        if not self.garmin_email.get() or not self.garmin_password.get():
+            return False, ["Garmin email or password not set"]
+        
+        wahoo = self.wahoo_folder.get()
+        mywhoosh = self.mywhoosh_folder.get()
+        if not wahoo and not mywhoosh:
+            return False, ["No folders configured"]
+        
+        warnings = []
+        if wahoo and not os.path.isdir(wahoo):
+            warnings.append(f"Wahoo folder not found, skipping: {wahoo}")
+        if mywhoosh and not os.path.isdir(mywhoosh):
+            warnings.append(f"MyWhoosh folder not found, skipping: {mywhoosh}")
+        return True, warnings
+    
     def validate_settings(self):
+        """Check settings before a sync started by the user, asking about missing folders"""
         if not self.garmin_email.get() or not self.garmin_password.get():
             messagebox.showerror("Error", "Please enter your Garmin email and password")
             log_warning("Sync attempted without Garmin credentials")
@@ -1087,8 +1703,9 @@ You can select and copy text from this window!"""
                     email = self.config.get('garmin_email', '')
                 
                 # Create session directory specific to this user
-                user_session_dir = os.path.join(self.session_dir, email.replace('@', '_').replace('.', '_'))
+                user_session_dir = self._user_session_dir(email)
                 
+                from garminconnect import Garmin
                 # Try to create client with session_dir if supported
                 try:
                     self.garmin_client = Garmin(self.garmin_email.get(), self.garmin_password.get(), session_dir=user_session_dir)
@@ -1098,19 +1715,23 @@ You can select and copy text from this window!"""
                 
                 self.garmin_client.login()
                 log_success("Garmin login successful")
+                self._save_session_tokens(user_session_dir)
                 self.update_status("Logged into Garmin successfully", "green")
                 return True
             except Exception as e:
                 logger.error(f"Garmin login attempt {attempt + 1} failed: {str(e)}")
                 if attempt < max_retries - 1:
                     logger.info(f"Waiting {delay} seconds before retry...")
-                    time.sleep(delay)
+                    if self._quit_event.wait(timeout=delay):
+                        return False  # App is closing; don't keep retrying
                     # Increase delay for next attempt
                     delay *= 2  # Exponential backoff
                 else:
                     logger.error("All login attempts failed")
                     self.update_status(f"Garmin login failed: {str(e)}", "red")
-                    messagebox.showerror("Login Failed", f"Could not login to Garmin after {max_retries} attempts:\n{str(e)}")
+                    # Logins also run on sync threads; show the error from the Tk thread without waiting on it
+                    message = f"Could not login to Garmin after {max_retries} attempts:\n{str(e)}"
+                    self.root.after(0, lambda: messagebox.showerror("Login Failed", message))
         return False
     
     def login_garmin(self):
@@ -1118,15 +1739,29 @@ You can select and copy text from this window!"""
         return self.login_garmin_with_retry()
     
     def sync_now(self):
-        if not self.validate_settings():
+        if self._refuse_if_syncing() or not self.validate_settings():
             return
         
         # Run sync in background thread
-        thread = threading.Thread(target=self._sync_files, daemon=True)
-        thread.start()
+        self.monitor_thread = threading.Thread(target=self._sync_files, args=(self._new_upload_cancel(),), daemon=True)
+        self.monitor_thread.start()
     
-    def _sync_files(self):
-        self.sync_button.config(state='disabled')
+    def _new_upload_cancel(self):
+        """Fresh cancel flag for a new run; a stopped run that is still finishing keeps its own (set) one"""
+        self._upload_cancel = threading.Event()
+        return self._upload_cancel
+    
+    def _refuse_if_syncing(self):
+        """True (and say so) while an earlier sync is still running, so two runs never upload the same files"""
+        if self.monitor_thread and self.monitor_thread.is_alive():
+            self.update_status("The previous sync is still finishing, try again in a moment", "orange")
+            return True
+        return False
+    
+    def _sync_files(self, cancel):
+        """Upload new files from both folders; returns how many were uploaded (cancel: this run's stop flag)"""
+        # Runs on a worker thread: widget changes are posted to the Tk thread with root.after
+        self.root.after(0, lambda: self.sync_button.config(state='disabled'))
         
         # Try to login with session first, then credentials if needed
         if not self.garmin_client:
@@ -1134,103 +1769,123 @@ You can select and copy text from this window!"""
             if not self.try_session_login():
                 # If session login failed, try credentials
                 if not self.login_garmin():
-                    self.sync_button.config(state='normal')
-                    return
+                    self.root.after(0, lambda: self.sync_button.config(state='normal'))
+                    return 0
         
         uploaded_count = 0
         last_uploaded_file = None
         
         # Sync Wahoo files
         wahoo_folder = self.wahoo_folder.get()
-        if wahoo_folder and os.path.isdir(wahoo_folder):
-            count, last_file = self._process_folder(wahoo_folder, "Wahoo")
+        if wahoo_folder:  # _process_folder skips folders that don't exist
+            count, last_file = self._process_folder(wahoo_folder, "Wahoo", cancel)
             uploaded_count += count
             if last_file:
                 last_uploaded_file = last_file
         
         # Sync MyWhoosh files
         mywhoosh_folder = self.mywhoosh_folder.get()
-        if mywhoosh_folder and os.path.isdir(mywhoosh_folder):
-            count, last_file = self._process_folder(mywhoosh_folder, "MyWhoosh")
+        if mywhoosh_folder and not cancel.is_set():  # _process_folder skips folders that don't exist
+            count, last_file = self._process_folder(mywhoosh_folder, "MyWhoosh", cancel)
             uploaded_count += count
             if last_file:
                 last_uploaded_file = last_file
         
         # Update UI
         current_time = time.strftime("%Y-%m-%d %H:%M:%S")
-        self.last_sync_label.config(text=f"Last sync: {current_time}")
+        self.root.after(0, lambda: self.last_sync_label.config(text=f"Last sync: {current_time}"))
         
         if uploaded_count > 0:
             self.update_status(f"Sync complete! Uploaded {uploaded_count} activities", "green")
             # Update last upload info
             upload_time = time.strftime("%Y-%m-%d %H:%M")
-            self.last_upload_label.config(
-                text=f"Last upload: {upload_time} - {uploaded_count} file(s) - Latest: {last_uploaded_file}",
-                foreground='green'
-            )
+            upload_text = f"Last upload: {upload_time} - {uploaded_count} file(s) - Latest: {last_uploaded_file}"
+            self.root.after(0, lambda: self.last_upload_label.config(text=upload_text, foreground='green'))
             log_success(f"Sync completed: {uploaded_count} activities uploaded")
         else:
             self.update_status("Sync complete - no new activities found", "blue")
             log_success("Sync completed: No new activities found")
         
-        self.sync_button.config(state='normal')
+        self.root.after(0, lambda: self.sync_button.config(state='normal'))
+        return uploaded_count
     
-    def _process_folder(self, folder, source_name):
+    def _process_folder(self, folder, source_name, cancel):
         uploaded = 0
         last_uploaded_file = None
         uploaded_folder = os.path.join(folder, "uploaded")
-        os.makedirs(uploaded_folder, exist_ok=True)
+        
+        # One directory read; a missing folder shows up here instead of via a separate isdir check
+        try:
+            with os.scandir(folder) as it:
+                entries = list(it)
+        except (FileNotFoundError, NotADirectoryError):
+            logger.info(f"{source_name} folder not found, skipping: {folder}")
+            return 0, None
+        except OSError as e:
+            log_error(f"Error processing {source_name} folder: {str(e)}")
+            self.update_status(f"Error processing {source_name} folder: {str(e)}", "red")
+            return 0, None
+        
+        # Cheap name check before the type check (scandir returns the type with each entry)
+        fit_entries = [entry for entry in entries
+                       if entry.name.lower().endswith('.fit') and entry.is_file(follow_symlinks=False)]
+        if not fit_entries:
+            # The usual idle tick: no manifest, no folder creation, no log lines
+            logger.debug(f"No .fit files in {source_name} folder: {folder}")
+            return 0, None
+        
+        # The listing above already tells whether uploaded/ exists, so only create it when missing
+        if not any(entry.name.lower() == "uploaded" and entry.is_dir() for entry in entries):
+            os.makedirs(uploaded_folder, exist_ok=True)
         
         # Add blank line before new job for better log grouping
         log_separator()
         logger.info(f"Processing {source_name} folder: {folder}")
         
         try:
-            for filename in os.listdir(folder):
-                # Skip the 'uploaded' subfolder
-                if filename == 'uploaded':
+            # Collect the .fit files first (on Windows, scandir also returns the mtime with each
+            # entry), oldest first so uploads start in activity order and nothing moves while listing
+            # Files whose move failed (locked, copied instead) stay here; the manifest of
+            # (name, size, mtime_ns) keys keeps them from being uploaded again every tick
+            done = self._load_uploaded_manifest(uploaded_folder)
+            still_present = set()
+            candidates = []
+            for entry in fit_entries:
+                st = entry.stat()
+                key = (entry.name, st.st_size, st.st_mtime_ns)
+                if key in done:
+                    still_present.add(key)
                     continue
-                    
-                if filename.lower().endswith('.fit'):
-                    file_path = os.path.join(folder, filename)
-                    
-                    if os.path.isfile(file_path):
-                        self.update_status(f"Uploading {filename}...", "orange")
-                        log_info(f"Uploading file: {filename} from {source_name}")
-                        
-                        try:
-                            self._maybe_log_upload_day_marker()
-                            self.garmin_client.upload_activity(file_path)
-                            uploaded += 1
-                            last_uploaded_file = filename
-                            log_success(f"Successfully uploaded: {filename}")
-                            upload_logger.info(f"Uploaded: {filename}")
-                            
-
-                            # Move to uploaded folder
-                            dest_path = os.path.join(uploaded_folder, filename)
-                            try:
-                                shutil.move(file_path, dest_path)
-                                log_info(f"Moved {filename} to uploaded folder")
-                            except PermissionError:
-                                shutil.copy2(file_path, dest_path)
-                                log_warning(f"File locked, copied instead of moved: {filename}")
-                            
-                            self.update_status(f"Uploaded {filename}", "green")
-                        
-                        except Exception as e:
-                            error_msg = str(e)
-                            if "409" in error_msg or "Conflict" in error_msg:
-                                log_info(f"File already uploaded (409 conflict): {filename}")
-                                # Already uploaded, move it
-                                dest_path = os.path.join(uploaded_folder, filename)
-                                try:
-                                    shutil.move(file_path, dest_path)
-                                except PermissionError:
-                                    shutil.copy2(file_path, dest_path)
-                            else:
-                                log_error(f"Failed to upload {filename}: {error_msg}")
-                                self.update_status(f"Failed to upload {filename}: {error_msg}", "red")
+                candidates.append((st.st_mtime, entry.name, entry.path, key))
+            candidates.sort()
+            
+            if candidates:
+                self._maybe_log_upload_day_marker()
+            
+            # Uploads are network-bound, so run a few at once
+            with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as pool:
+                futures = {
+                    pool.submit(self._upload_one, file_path, filename, uploaded_folder, source_name, cancel): (mtime, filename, key)
+                    for mtime, filename, file_path, key in candidates
+                }
+                newest = None
+                for future in as_completed(futures):
+                    mtime, filename, key = futures[future]
+                    result, left_in_folder = future.result()
+                    if left_in_folder:
+                        still_present.add(key)  # Handled but couldn't be moved out: don't upload it again
+                    if result:
+                        uploaded += 1
+                        if newest is None or (mtime, filename) > newest:
+                            newest = (mtime, filename)
+                if newest:
+                    last_uploaded_file = newest[1]
+            if candidates and cancel.is_set():
+                log_info(f"Sync stopped, remaining {source_name} files will upload on the next sync")
+            
+            # Only keep keys for files still in the folder, so the manifest stays small
+            if still_present != done:
+                self._save_uploaded_manifest(uploaded_folder, still_present)
         
         except Exception as e:
             log_error(f"Error processing {source_name} folder: {str(e)}")
@@ -1246,6 +1901,103 @@ You can select and copy text from this window!"""
         log_separator()
         return uploaded, last_uploaded_file
     
+    def _load_uploaded_manifest(self, uploaded_folder):
+        """Return the set of (name, size, mtime_ns) keys already handled for this folder"""
+        try:
+            with open(os.path.join(uploaded_folder, UPLOADED_MANIFEST), 'rb') as f:
+                return {tuple(key) for key in json_loads(f.read())}
+        except (OSError, ValueError, TypeError):
+            return set()
+    
+    def _save_uploaded_manifest(self, uploaded_folder, keys):
+        """Write the handled-file keys for this folder (temp file + swap, like the config)"""
+        manifest_file = os.path.join(uploaded_folder, UPLOADED_MANIFEST)
+        try:
+            with open(manifest_file + '.tmp', 'wb') as f:
+                f.write(json_dumps(sorted(keys)))
+            os.replace(manifest_file + '.tmp', manifest_file)
+        except OSError as e:
+            log_warning(f"Could not save upload manifest {manifest_file}: {e}")
+    
+    def _upload_one(self, file_path, filename, uploaded_folder, source_name, cancel):
+        """
+        Upload one .fit file and move it to the uploaded folder.
+        Returns (result, left_in_folder): result is True if it was uploaded, False if Garmin
+        already had it (409), None on failure or when the sync was stopped before this file's
+        turn; left_in_folder is True when a handled file could not be moved out of the folder.
+        """
+        if cancel.is_set():
+            return None, False  # Not in the manifest, so the next sync picks it up
+        self.update_status(f"Uploading {filename}...", "orange")
+        # Per-file progress is debug-only; the outcome below is the one INFO/ERROR line per file
+        logger.debug(f"Uploading file: {filename} from {source_name}")
+        # uploaded/ is inside the source folder, so a plain atomic rename normally works
+        dest_path = os.path.join(uploaded_folder, filename)
+        
+        try:
+            self._upload_with_retry(file_path, filename, cancel)
+        except Exception as e:
+            status = http_status_code(e)
+            # The message is only formatted when there's no status to go by, or to report the failure
+            error_msg = None
+            if status is None:
+                # No response attached (older garminconnect wraps errors as plain text)
+                error_msg = str(e)
+                duplicate = "409" in error_msg or "Conflict" in error_msg
+            else:
+                duplicate = status == 409
+            if duplicate:
+                log_info(f"File already uploaded (409 conflict): {filename}")
+                # Already uploaded, move it
+                return False, not self._move_to_uploaded(file_path, dest_path, filename)
+            if error_msg is None:
+                error_msg = str(e)
+            log_error(f"Failed to upload {filename}: {error_msg}")
+            self.update_status(f"Failed to upload {filename}: {error_msg}", "red")
+            return None, False
+        
+        log_success(f"Successfully uploaded: {filename}")
+        upload_logger.info(f"Uploaded: {filename}")
+        # Move to uploaded folder (a failed move is only logged; the upload still counts)
+        moved = self._move_to_uploaded(file_path, dest_path, filename)
+        self.update_status(f"Uploaded {filename}", "green")
+        return True, not moved
+    
+    def _upload_with_retry(self, file_path, filename, cancel):
+        """Upload a file, retrying transient failures with exponential backoff; 409 and other errors raise at once"""
+        for attempt in range(UPLOAD_ATTEMPTS):
+            try:
+                return self.garmin_client.upload_activity(file_path)
+            except Exception as e:
+                if attempt == UPLOAD_ATTEMPTS - 1 or not is_transient_http_error(e):
+                    raise
+                delay = 2 ** attempt
+                logger.info(f"Upload of {filename} failed ({e}), retrying in {delay}s")
+                if cancel.wait(timeout=delay):
+                    raise  # Sync stopped while waiting: report the last error
+    
+    def _move_to_uploaded(self, file_path, dest_path, filename):
+        """Move a handled file into uploaded/; normally a single rename. Returns False if it is still in the source folder"""
+        try:
+            os.replace(file_path, dest_path)
+            logger.debug(f"Moved {filename} to uploaded folder")
+            return True
+        except PermissionError:
+            locked = True  # Still open elsewhere: leave it, the manifest stops re-uploads
+        except OSError:
+            locked = False  # e.g. uploaded/ is a junction onto another volume
+        try:
+            shutil.copy2(file_path, dest_path)
+            if not locked:
+                os.unlink(file_path)
+                logger.debug(f"Moved {filename} to uploaded folder (copy + delete)")
+                return True
+        except OSError as e:
+            log_warning(f"Could not move {filename} to uploaded folder: {e}")
+            return not os.path.exists(file_path)  # The copy may have gone through before the delete failed
+        log_warning(f"File locked, copied instead of moved: {filename}")
+        return False
+    
     def toggle_monitoring(self):
         if self.is_monitoring:
             self.stop_monitoring()
@@ -1253,7 +2005,7 @@ You can select and copy text from this window!"""
             self.start_monitoring()
     
     def start_monitoring(self):
-        if not self.validate_settings():
+        if self._refuse_if_syncing() or not self.validate_settings():
             return
         
         if not self.garmin_client:
@@ -1269,26 +2021,108 @@ You can select and copy text from this window!"""
         self.sync_button.config(state='disabled')
         self.update_status("Auto-sync started (checking every 5 minutes)", "green")
         
-        # Start monitoring thread
-        self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
-        self.monitor_thread.start()
+        # First run now; each later one is a Tk timer, so nothing waits between runs
+        self._monitor_run += 1
+        self._fit_event_pending = False
+        self._idle_runs = 0
+        self._new_upload_cancel()
+        self._run_monitor_tick(self._monitor_run)
+        self._start_folder_watch(self._monitor_run)
     
     def stop_monitoring(self):
         logger.info("Stopping auto-sync monitoring")
         self.is_monitoring = False
+        self._upload_cancel.set()  # Uploads already running finish; queued ones are skipped
+        self._monitor_run += 1
+        if self._monitor_after_id:
+            self.root.after_cancel(self._monitor_after_id)
+            self._monitor_after_id = None
+        self._stop_folder_watch()
         self.monitor_button.config(text="Start Auto-Sync")
         self.sync_button.config(state='normal')
         self.update_status("Auto-sync stopped", "blue")
     
-    def _monitor_loop(self):
-        while self.is_monitoring:
-            self._sync_files()
-            
-            # Wait using check_interval
-            for _ in range(self.check_interval):
-                if not self.is_monitoring:
-                    break
-                time.sleep(1)
+    def _run_monitor_tick(self, run):
+        """Start one auto-sync run on a worker thread (Tk thread)"""
+        self._monitor_after_id = None
+        if run != self._monitor_run:
+            return
+        if self.monitor_thread and self.monitor_thread.is_alive():
+            # A manual sync is still running: try again once it has had time to finish
+            self._monitor_after_id = self.root.after(WATCH_SETTLE_MS, self._run_monitor_tick, run)
+            return
+        self.monitor_thread = threading.Thread(target=self._monitor_tick, args=(run, self._upload_cancel), daemon=True)
+        self.monitor_thread.start()
+    
+    def _monitor_tick(self, run, cancel):
+        uploaded = 0
+        try:
+            # A folder can go missing between runs (USB stick, network drive): log and carry on
+            ok, warnings = self.validate_settings_silent()
+            for warning in warnings:
+                log_warning(warning)
+            if ok:
+                uploaded = self._sync_files(cancel) or 0
+            else:
+                log_warning("Auto-sync run skipped: " + "; ".join(warnings))
+        finally:
+            # Next run check_interval after this one finished
+            self.root.after(0, self._schedule_monitor_tick, run, uploaded)
+    
+    def _schedule_monitor_tick(self, run, uploaded=0):
+        if run == self._monitor_run and self._monitor_after_id is None:
+            self._idle_runs = 0 if uploaded else self._idle_runs + 1
+            if self._fit_event_pending:
+                # Files that arrived during the last run get picked up shortly instead of next interval
+                delay = WATCH_SETTLE_MS
+            elif self._observer:
+                # Folder events start runs for new files, so the timed rescan is only a safety net:
+                # double it per empty run (up to 8x, capped) and go back to the set interval after an upload
+                interval = self.check_interval * (1 << min(self._idle_runs, 3))
+                delay = max(self.check_interval, min(interval, MONITOR_BACKOFF_MAX_S)) * 1000
+            else:
+                delay = self.check_interval * 1000
+            self._fit_event_pending = False
+            self._monitor_after_id = self.root.after(delay, self._run_monitor_tick, run)
+    
+    def _start_folder_watch(self, run):
+        """Watch the sync folders so new .fit files are uploaded without waiting for the timer.
+        The timed rescan stays on as the fallback (network drives, Dropbox, missed events)."""
+        if Observer is None:
+            return
+        observer = Observer()
+        watched = 0
+        for folder in (self.wahoo_folder.get(), self.mywhoosh_folder.get()):
+            if not folder:
+                continue
+            # Called on the observer thread; the Tk thread takes it from there
+            handler = FitFileHandler(folder, lambda: self.root.after(0, self._on_fit_file_event, run))
+            try:
+                observer.schedule(handler, folder, recursive=False)
+                watched += 1
+            except OSError as e:
+                log_warning(f"Can't watch {folder} for new files, relying on the timer: {e}")
+        if watched:
+            observer.daemon = True
+            observer.start()
+            self._observer = observer
+            logger.info(f"Watching {watched} folder(s) for new .fit files")
+    
+    def _stop_folder_watch(self):
+        if self._observer:
+            self._observer.stop()  # Not joined: its thread is a daemon and exits on its own
+            self._observer = None
+    
+    def _on_fit_file_event(self, run):
+        """A .fit file changed in a watched folder (Tk thread): sync once writes go quiet"""
+        if run != self._monitor_run:
+            return
+        if self.monitor_thread and self.monitor_thread.is_alive():
+            self._fit_event_pending = True  # _schedule_monitor_tick follows up after this run
+            return
+        if self._monitor_after_id:
+            self.root.after_cancel(self._monitor_after_id)
+        self._monitor_after_id = self.root.after(WATCH_SETTLE_MS, self._run_monitor_tick, run)
     
     def update_status(self, message, color="blue"):
         # Add colored icons based on status type
@@ -1302,8 +2136,25 @@ You can select and copy text from this window!"""
         elif color == "blue":
             icon = "ℹ️ "  # Info
         
-        self.status_label.config(text=f"Status: {icon}{message}", foreground=color)
-        self.root.update_idletasks()
+        # Called from worker threads too: only the newest status is kept, and the label is
+        # updated on the Tk thread at most once per STATUS_FLUSH_MS
+        status = (f"Status: {icon}{message}", color)
+        with self._status_lock:
+            if self._pending_status is None and status == self._shown_status:
+                return  # Already on screen (e.g. repeated auto-sync results)
+            schedule = self._pending_status is None
+            self._pending_status = status
+        if schedule:
+            self.root.after(STATUS_FLUSH_MS, self._flush_status)
+    
+    def _flush_status(self):
+        """Show the latest status passed to update_status"""
+        with self._status_lock:
+            pending, self._pending_status = self._pending_status, None
+        if pending and pending != self._shown_status:
+            text, color = pending
+            self.status_label.config(text=text, foreground=color)
+            self._shown_status = pending
     
     def minimize_to_tray(self):
         """Explicitly minimize to system tray"""
@@ -1336,6 +2187,7 @@ You can select and copy text from this window!"""
     def on_closing(self):
         """Handle window close - ask user if they want to run in background or close"""
         # Check for unsaved settings first
+        self.flush_settings_changed()
         if self.settings_changed:
             response = messagebox.askyesnocancel(
                 "Unsaved Changes",
@@ -1344,8 +2196,15 @@ You can select and copy text from this window!"""
             if response is None:  # Cancel
                 return
             elif response:  # Yes - save
-                self.save_settings()
+                # Saving waits for the credential check; carry on closing only once it saved
+                # (if validation fails the window stays open with its error shown)
+                self.save_settings(on_saved=self._ask_close_action)
+                return
         
+        self._ask_close_action()
+    
+    def _ask_close_action(self):
+        """Ask whether to keep running in the tray or quit (second half of on_closing)"""
         # Always ask user what they want to do
         if self.is_monitoring:
             # Already running - ask if they want to keep running or close
@@ -1384,13 +2243,22 @@ You can select and copy text from this window!"""
     
     def create_tray_icon(self):
         """Create system tray icon"""
-        if self.tray_icon:
-            return  # Already created
+        if self.tray_icon and self._tray_thread.is_alive():
+            return  # Already created and running
+        if self._tray_available is False:
+            return  # pystray failed to import before; don't retry on every minimize
         
         try:
-            # Load icon image
-            if os.path.exists(LOGO_PATH):
-                icon_image = Image.open(LOGO_PATH)
+            # pystray is only needed once the app goes to the tray
+            try:
+                from pystray import Icon, Menu, MenuItem
+            except ImportError:
+                self._tray_available = False
+                raise
+            
+            # Icon image: a copy of the logo decoded at startup (pystray uses it on its own thread)
+            if self._logo_pil is not None:
+                icon_image = self._logo_pil.copy()
             else:
                 # Create a simple default icon if logo not found
                 icon_image = Image.new('RGB', (64, 64), color='blue')
@@ -1406,9 +2274,10 @@ You can select and copy text from this window!"""
             self.tray_icon = Icon("GarminUploader", icon_image, "Garmin Uploader", menu)
             
             # Run in separate thread
-            threading.Thread(target=self.tray_icon.run, daemon=True).start()
-        except Exception as e:
-            print(f"Could not create tray icon: {e}")
+            self._tray_thread = threading.Thread(target=self.tray_icon.run, daemon=True)
+            self._tray_thread.start()
+        except Exception:
+            logger.exception("Could not create tray icon")
     
     def show_window(self, icon=None, item=None):
         """Show the main window from tray"""
@@ -1417,16 +2286,28 @@ You can select and copy text from this window!"""
     
     def tray_sync_now(self, icon=None, item=None):
         """Trigger sync from tray menu"""
-        threading.Thread(target=self._sync_files, daemon=True).start()
+        self.root.after(0, self._tray_sync)  # Called on the tray thread; the run state lives on the Tk thread
+    
+    def _tray_sync(self):
+        if self._refuse_if_syncing():
+            return
+        # Like Sync Now; during auto-sync the run shares auto-sync's flag, so Stop cancels it too
+        cancel = self._upload_cancel if self.is_monitoring else self._new_upload_cancel()
+        self.monitor_thread = threading.Thread(target=self._sync_files, args=(cancel,), daemon=True)
+        self.monitor_thread.start()
     
     def quit_app(self, icon=None, item=None):
         """Quit the application completely"""
+        self._quit_event.set()
+        self._upload_cancel.set()
         if self.is_monitoring:
             self.stop_monitoring()
         
         if self.tray_icon:
             self.tray_icon.stop()
         
+        self._stop_powershell()
+        
         self.root.quit()
         self.root.destroy()
     
@@ -1435,30 +2316,24 @@ You can select and copy text from this window!"""
         about_window = tk.Toplevel(self.root)
         about_window.title("About Garmin Connect Uploader")
         # Apply DPI scaling
-        base_width, base_height = 500, 420
-        width = int(base_width * (self.scaling / 1.33))
-        height = int(base_height * (self.scaling / 1.33))
-        about_window.geometry(f"{width}x{height}")
+        about_window.geometry(self.scaled_geometry(500, 420))
         about_window.resizable(False, False)
         
         # Icon/logo at top
         try:
-            if os.path.exists(LOGO_PATH):
-                logo_img = Image.open(LOGO_PATH)
-                logo_img.thumbnail((64, 64))
-                self.about_logo = ImageTk.PhotoImage(logo_img)
+            about_logo = self.get_logo_photo(64)
         except Exception:
-            self.about_logo = None
+            about_logo = None
         
         # Container
         content = ttk.Frame(about_window, padding=15)
         content.pack(fill=tk.BOTH, expand=True)
         
         # Logo row (optional)
-        if self.about_logo:
+        if about_logo:
             logo_row = ttk.Frame(content)
             logo_row.pack(pady=(0, 10))
-            ttk.Label(logo_row, image=self.about_logo).pack()
+            ttk.Label(logo_row, image=about_logo).pack()
         
         # Title
         ttk.Label(content, text="Garmin Connect Uploader", font=('Arial', 14, 'bold')).pack()
@@ -1472,17 +2347,10 @@ You can select and copy text from this window!"""
         ttk.Label(content, text="Developer", font=('Arial', 11, 'bold')).pack(pady=(10, 5))
         
         # Try to load developer logo
-        dev_logo_path = DEV_LOGO_PATH
-        if dev_logo_path and os.path.exists(dev_logo_path):
-            try:
-                dev_logo_img = Image.open(dev_logo_path)
-                dev_logo_img.thumbnail((75, 75))  # Increased by 25% (60 -> 75)
-                dev_logo_photo = ImageTk.PhotoImage(dev_logo_img)
-                logo_label = ttk.Label(content, image=dev_logo_photo)
-                logo_label.image = dev_logo_photo  # Keep reference
-                logo_label.pack(pady=5)
-            except:
-                pass  # If fails, just skip the logo
+        dev_logo_photo = self.get_image_photo(DEV_LOGO_PATH, 75)  # Increased by 25% (60 -> 75)
+        if dev_logo_photo:  # If it fails, just skip the logo
+            logo_label = ttk.Label(content, image=dev_logo_photo)  # Reference kept by get_image_photo
+            logo_label.pack(pady=5)
         
         dev_frame = ttk.Frame(content)
         dev_frame.pack(pady=5)
@@ -1492,27 +2360,22 @@ You can select and copy text from this window!"""
         github_frame.pack(pady=5)
         
         # Try to load GitHub logo
-        github_logo_path = GITHUB_LOGO_PATH
-        if github_logo_path and os.path.exists(github_logo_path):
-            try:
-                github_img = Image.open(github_logo_path)
-                github_img.thumbnail((96, 96))  # Much larger - 3x bigger
-                github_photo = ImageTk.PhotoImage(github_img)
-                github_logo_label = ttk.Label(github_frame, image=github_photo, cursor='hand2')
-                github_logo_label.image = github_photo  # Keep reference
-                github_logo_label.pack()
-                github_logo_label.bind("<Button-1>", lambda e: webbrowser.open("https://github.com/Inc21"))
-            except:
-                # Fallback to text if logo fails
-                github_link = ttk.Label(
-                    github_frame,
-                    text="github.com/Inc21",
-                    foreground='blue',
-                    cursor='hand2',
-                    font=('Arial', 9, 'underline')
-                )
-                github_link.pack()
-                github_link.bind("<Button-1>", lambda e: webbrowser.open("https://github.com/Inc21"))
+        github_photo = self.get_image_photo(GITHUB_LOGO_PATH, 96)  # Much larger - 3x bigger
+        if github_photo:
+            github_logo_label = ttk.Label(github_frame, image=github_photo, cursor='hand2')
+            github_logo_label.pack()
+            github_logo_label.bind("<Button-1>", lambda e: webbrowser.open("https://github.com/Inc21"))
+        else:
+            # Fallback to text if logo fails
+            github_link = ttk.Label(
+                github_frame,
+                text="github.com/Inc21",
+                foreground='blue',
+                cursor='hand2',
+                font=('Arial', 9, 'underline')
+            )
+            github_link.pack()
+            github_link.bind("<Button-1>", lambda e: webbrowser.open("https://github.com/Inc21"))
         
         # Buttons frame
         btn_frame = ttk.Frame(content)
@@ -1552,58 +2415,122 @@ You can select and copy text from this window!"""
         req_h = about_window.winfo_reqheight()
         about_window.minsize(req_w, req_h)
     
+    def _log_file_identity(self, f):
+        """(st_dev, st_ino, first bytes) of an open log file; changes when the log is rotated.
+        The leading bytes also cover file systems that report no inode number."""
+        st = os.fstat(f.fileno())
+        position = f.tell()
+        f.seek(0)
+        first = f.read(LOG_IDENTITY_BYTES)
+        f.seek(position)
+        return st.st_dev, st.st_ino, first
+    
     def open_log_file(self):
         """Open the log file in a viewer window (opens at the end)"""
         try:
-            if not os.path.exists(LOG_FILE):
-                messagebox.showinfo("Log File", f"Log file not found yet.\n\nIt will be created at:\n{LOG_FILE}\n\nonce you start using the app.")
-                return
+            if log_ring_handler.is_full():
+                # This session has logged at least a screenful: show the recent records from
+                # memory; 'Load Full Log' replaces them with the whole file
+                tail = size = head_size = log_identity = None
+            else:
+                # Read the end of the log file (include records still in the write buffer)
+                file_handler.flush()
+                try:
+                    with open(LOG_FILE, 'rb') as f:
+                        log_identity = self._log_file_identity(f)
+                        f.seek(0, os.SEEK_END)
+                        size = f.tell()
+                        f.seek(max(0, size - LOG_VIEW_TAIL_BYTES))
+                        tail = f.read()
+                except FileNotFoundError:
+                    messagebox.showinfo("Log File", f"Log file not found yet.\n\nIt will be created at:\n{LOG_FILE}\n\nonce you start using the app.")
+                    return
+                if size > LOG_VIEW_TAIL_BYTES:
+                    tail = tail[tail.find(b'\n') + 1:]  # Skip the partial first line
+                head_size = size - len(tail)  # Older part of the log, loaded on request
             
             # Create a viewer window
             log_window = tk.Toplevel(self.root)
             log_window.title("Garmin Uploader - Log File")
             
             # Apply DPI scaling
-            base_width, base_height = 900, 600
-            width = int(base_width * (self.scaling / 1.33))
-            height = int(base_height * (self.scaling / 1.33))
-            log_window.geometry(f"{width}x{height}")
+            log_window.geometry(self.scaled_geometry(900, 600))
             
             # Create scrolled text widget
             text_widget = scrolledtext.ScrolledText(
                 log_window,
                 wrap=tk.WORD,
-                font=('Courier New', 9)
+                font=('Courier New', 9),
+                undo=False,
+                autoseparators=False  # Read-only view: no undo bookkeeping for the bulk inserts
             )
             text_widget.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
             
-            # Read and display log file
-            with open(LOG_FILE, 'r', encoding='utf-8') as f:
-                log_content = f.read()
-                text_widget.insert(1.0, log_content)
+            if tail is None:
+                text_widget.insert(1.0, log_ring_handler.text())
+            else:
+                # Read as bytes for the offsets: undo the CRLF that text-mode logging wrote on Windows
+                text_widget.insert(1.0, tail.decode('utf-8', 'replace').replace('\r\n', '\n'))
+            # Read-only from here on (selection, copy and Ctrl+F still work); inserts below
+            # re-enable it briefly
+            text_widget.configure(state='disabled')
             
             # Scroll to the end
             text_widget.see(tk.END)
             
-            # Make text selectable but prevent editing
-            # Bind keys to prevent modification while allowing Ctrl+F search
-            def block_edit(event):
-                # Allow Ctrl+C (copy), Ctrl+A (select all), Ctrl+F (find), arrow keys, etc.
-                if event.state & 0x4:  # Ctrl is pressed
-                    return  # Allow Ctrl+key combinations
-                if event.keysym in ('Left', 'Right', 'Up', 'Down', 'Home', 'End', 'Prior', 'Next'):
-                    return  # Allow navigation
-                return "break"  # Block other keys
+            # Add search functionality with Ctrl+F
+            text_widget.tag_configure('found', background='yellow', foreground='black')
+            # Searches run on a Python copy of the text (much faster than Tk's search on big
+            # logs); the copy is taken on first use and dropped when text is added
+            search_start = 0  # Character offset where Find Next continues
+            match_start = 0  # Character offset of the current match (search-as-you-type restarts here)
+            search_cache = None  # Widget text
+            search_line_starts = None  # Offset where each line of search_cache starts
+            search_finder = (None, None)  # (term, find function) of the last search
+            found_range = None  # (start, end) covering the current highlights, None if there are none
             
-            text_widget.bind("<Key>", block_edit)
+            def clear_found():
+                nonlocal found_range
+                if found_range:
+                    text_widget.tag_remove('found', *found_range)
+                    found_range = None
             
-            # Add search functionality with Ctrl+F
-            search_start_index = '1.0'
+            def offset_index(offset):
+                """Tk 'line.col' index for a character offset into the search copy"""
+                # A binary search over line starts, so Tk doesn't count characters from 1.0
+                line = bisect_right(search_line_starts, offset)
+                return f"{line}.{offset - search_line_starts[line - 1]}"
+            
+            def get_search_text():
+                nonlocal search_cache, search_line_starts
+                if search_cache is None:
+                    search_cache = text_widget.get('1.0', 'end-1c')
+                    search_line_starts = [0]
+                    search_line_starts.extend(match.end() for match in NEWLINE_RE.finditer(search_cache))
+                return search_cache
+            
+            def get_search_finder(term):
+                """Return find(text, start, end) -> (start, end) span or None, built once per term"""
+                nonlocal search_finder
+                if search_finder[0] != term:
+                    if term.lower() == term.upper():
+                        # Nothing to case-fold (timestamps, numbers, ...): plain str.find is fastest
+                        def find(text, start, end):
+                            pos = text.find(term, start, end)
+                            return (pos, pos + len(term)) if pos != -1 else None
+                    else:
+                        pattern = re.compile(re.escape(term), re.IGNORECASE)
+                        
+                        def find(text, start, end):
+                            match = pattern.search(text, start, end)
+                            return match.span() if match else None
+                    search_finder = (term, find)
+                return search_finder[1]
             
             search_window = None  # Track search window to prevent multiple instances
             
             def find_text(event=None):
-                nonlocal search_start_index, search_window
+                nonlocal search_window
                 
                 # If search window already exists, focus it instead of creating new one
                 if search_window and search_window.winfo_exists():
@@ -1615,10 +2542,7 @@ You can select and copy text from this window!"""
                 search_window.title("Find in Log")
                 
                 # Apply DPI scaling
-                base_width, base_height = 500, 140
-                width = int(base_width * (self.scaling / 1.33))
-                height = int(base_height * (self.scaling / 1.33))
-                search_window.geometry(f"{width}x{height}")
+                search_window.geometry(self.scaled_geometry(500, 140))
                 search_window.resizable(False, False)
                 search_window.transient(log_window)
                 
@@ -1627,49 +2551,169 @@ You can select and copy text from this window!"""
                 search_entry.pack(pady=5, padx=15, fill='x')
                 search_entry.focus()
                 
-                def do_search():
-                    nonlocal search_start_index
+                def do_search(typing=False):
+                    nonlocal search_start, match_start, found_range
                     search_term = search_entry.get()
                     if not search_term:
                         return
+                    if typing:
+                        # The term grew or changed: re-match at the current hit instead of moving on
+                        search_start = match_start
                     
-                    # Remove previous highlights
-                    text_widget.tag_remove('found', '1.0', tk.END)
+                    # Remove previous highlights (just their range, not a scan of the whole text)
+                    clear_found()
                     
-                    # Search from current position
-                    pos = text_widget.search(search_term, search_start_index, tk.END, nocase=True)
-                    if pos:
-                        # Highlight found text
-                        end_pos = f"{pos}+{len(search_term)}c"
-                        text_widget.tag_add('found', pos, end_pos)
-                        text_widget.tag_config('found', background='yellow', foreground='black')
-                        text_widget.see(pos)
-                        search_start_index = end_pos
+                    # Search from current position (case-insensitive)
+                    find = get_search_finder(search_term)
+                    text = get_search_text()
+                    span = find(text, search_start, len(text))
+                    if span is None and search_start:
+                        # Not found or reached end, wrap to beginning; only the part before the
+                        # current position is left to scan (plus room for a match straddling it)
+                        span = find(text, 0, search_start + len(search_term))
+                    if span is not None:
+                        # Highlight found text (Tk resolves the offset form itself, no index() round trip)
+                        found_range = (offset_index(span[0]), offset_index(span[1]))
+                        text_widget.tag_add('found', *found_range)
+                        text_widget.see(found_range[0])
+                        match_start, search_start = span
+                        search_window.title("Find in Log")
                     else:
-                        # Not found or reached end, wrap to beginning
-                        search_start_index = '1.0'
-                        pos = text_widget.search(search_term, search_start_index, tk.END, nocase=True)
-                        if pos:
-                            end_pos = f"{pos}+{len(search_term)}c"
-                            text_widget.tag_add('found', pos, end_pos)
-                            text_widget.tag_config('found', background='yellow', foreground='black')
-                            text_widget.see(pos)
-                            search_start_index = end_pos
+                        search_start = match_start = 0
+                        if typing:
+                            search_window.title("Find in Log - not found")
                         else:
                             messagebox.showinfo("Not Found", f"'{search_term}' not found in log.", parent=search_window)
                 
+                # Search as you type, once typing pauses for SEARCH_DEBOUNCE_MS
+                search_after_id = None
+                typed_term = ''
+                
+                def search_typed_term():
+                    nonlocal search_after_id, typed_term
+                    search_after_id = None
+                    if not search_window.winfo_exists():
+                        return
+                    term = search_entry.get()
+                    if term != typed_term:  # Ignore keys that didn't change the text (arrows, Enter)
+                        typed_term = term
+                        do_search(typing=True)
+                
+                def schedule_typed_search(event=None):
+                    nonlocal search_after_id
+                    if search_after_id is not None:
+                        search_entry.after_cancel(search_after_id)
+                    search_after_id = search_entry.after(SEARCH_DEBOUNCE_MS, search_typed_term)
+                
+                def highlight_all():
+                    nonlocal found_range
+                    # Comma-separated terms are matched together in a single pass over the text
+                    terms = {term.strip() for term in search_entry.get().split(',') if term.strip()}
+                    if not terms:
+                        return
+                    # Longest first, so where terms overlap the longer one wins
+                    pattern = re.compile('|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+                    ranges = []
+                    for match in pattern.finditer(get_search_text()):
+                        ranges.append(offset_index(match.start()))
+                        ranges.append(offset_index(match.end()))
+                    
+                    clear_found()
+                    if ranges:
+                        text_widget.tag_add('found', *ranges)  # One Tk call for every match
+                        found_range = ('1.0', tk.END)
+                        text_widget.see(ranges[0])
+                    search_window.title(f"Find in Log - {len(ranges) // 2} matches")
+                
                 btn_frame = ttk.Frame(search_window)
                 btn_frame.pack(pady=20)
                 ttk.Button(btn_frame, text="Find Next", command=do_search, width=15).pack(side='left', padx=10)
+                ttk.Button(btn_frame, text="Highlight All", command=highlight_all, width=15).pack(side='left', padx=10)
                 ttk.Button(btn_frame, text="Close", command=search_window.destroy, width=15).pack(side='left', padx=10)
                 
                 # Bind Enter key to search
                 search_entry.bind('<Return>', lambda e: do_search())
+                search_entry.bind('<KeyRelease>', schedule_typed_search)
             
             # Bind Ctrl+F to open search dialog
             text_widget.bind('<Control-f>', find_text)
             log_window.bind('<Control-f>', find_text)
             
+            # Offer the older part of a large log (or the whole file, when the view came from
+            # memory), read off the Tk thread and inserted in chunks
+            if head_size != 0:
+                replace_on_load = head_size is None
+                
+                def read_head():
+                    if replace_on_load:
+                        file_handler.flush()
+                        with open(LOG_FILE, 'rb') as f:
+                            return f.read().decode('utf-8', 'replace').replace('\r\n', '\n')
+                    # Re-read by offset rather than keeping the file open or mapped: an open
+                    # handle would stop the rotating handler renaming the log on Windows
+                    with open(LOG_FILE, 'rb') as f:
+                        # A rotated log can regrow past the old size, so check it is the same file
+                        if f.seek(0, os.SEEK_END) < size or self._log_file_identity(f) != log_identity:
+                            raise OSError("The log was rotated since this window opened; please reopen it")
+                        f.seek(0)
+                        return f.read(head_size).decode('utf-8', 'replace').replace('\r\n', '\n')
+                
+                def insert_chunks(content, start):
+                    nonlocal search_cache, search_line_starts, search_start, match_start, found_range
+                    if not log_window.winfo_exists():
+                        return
+                    chunk = content[start:start + LOG_VIEW_CHUNK_CHARS]
+                    text_widget.configure(state='normal')
+                    text_widget.insert('loaded', chunk)
+                    text_widget.configure(state='disabled')
+                    # The chunk went in at offset `start`: rebuild the search copy and line index,
+                    # and (unless it was appended to a cleared view) move offsets at or past it
+                    # along with the text
+                    search_cache = search_line_starts = None
+                    if not replace_on_load:
+                        if search_start >= start:
+                            search_start += len(chunk)
+                        if match_start >= start:
+                            match_start += len(chunk)
+                    if found_range:
+                        # The 'found' tag moved with the text; the stored line.col indices did not
+                        ranges = text_widget.tag_ranges('found')
+                        found_range = (str(ranges[0]), str(ranges[-1])) if ranges else None
+                    start += LOG_VIEW_CHUNK_CHARS
+                    if start < len(content):
+                        log_window.after(1, insert_chunks, content, start)
+                    else:
+                        load_btn.pack_forget()
+                
+                def poll_head(future):
+                    nonlocal search_start, match_start, found_range
+                    if not log_window.winfo_exists():
+                        return
+                    if not future.done():
+                        log_window.after(100, poll_head, future)
+                        return
+                    try:
+                        content = future.result()
+                    except Exception as e:
+                        load_btn.config(state='normal', text="Load Full Log")
+                        messagebox.showerror("Error", f"Could not read log file:\n{str(e)}", parent=log_window)
+                        return
+                    if replace_on_load:
+                        text_widget.configure(state='normal')
+                        text_widget.delete('1.0', tk.END)
+                        text_widget.configure(state='disabled')
+                        search_start = match_start = 0
+                        found_range = None
+                    text_widget.mark_set('loaded', '1.0')  # Right gravity: moves past each inserted chunk
+                    insert_chunks(content, 0)
+                
+                def load_full_log():
+                    load_btn.config(state='disabled', text="Loading...")
+                    poll_head(self._executor.submit(read_head))
+                
+                load_btn = ttk.Button(log_window, text="Load Full Log", command=load_full_log)
+                load_btn.pack(pady=(5, 0))
+            
             # Add close button
             close_btn = ttk.Button(log_window, text="Close", command=log_window.destroy)
             close_btn.pack(pady=5)
@@ -1683,7 +2727,10 @@ You can select and copy text from this window!"""
     def open_upload_log(self):
         """Open the upload-only log file (monthly)"""
         try:
-            if not os.path.exists(UPLOAD_LOG_FILE):
+            upload_handler.flush()  # Include records still in the write buffer
+            try:
+                log_file = open(UPLOAD_LOG_FILE, 'r', encoding='utf-8')
+            except FileNotFoundError:
                 messagebox.showinfo(
                     "Uploads Log",
                     f"Uploads log not found yet.\n\nIt will be created at:\n{UPLOAD_LOG_FILE}\n\nonce uploads occur."
@@ -1693,30 +2740,42 @@ You can select and copy text from this window!"""
             log_window = tk.Toplevel(self.root)
             log_window.title("Garmin Uploader - Uploads Log")
             
-            base_width, base_height = 800, 500
-            width = int(base_width * (self.scaling / 1.33))
-            height = int(base_height * (self.scaling / 1.33))
-            log_window.geometry(f"{width}x{height}")
+            log_window.geometry(self.scaled_geometry(800, 500))
             
             text_widget = scrolledtext.ScrolledText(
                 log_window,
                 wrap=tk.WORD,
-                font=('Courier New', 9)
+                font=('Courier New', 9),
+                undo=False,
+                autoseparators=False  # Read-only view: no undo bookkeeping for the bulk inserts
             )
             text_widget.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
             
-            with open(UPLOAD_LOG_FILE, 'r', encoding='utf-8') as f:
-                log_content = f.read()
-                text_widget.insert(1.0, log_content)
-            text_widget.see(tk.END)
+            # This log is never rotated, so stream it in chunks from idle callbacks rather
+            # than building one huge string and insert
+            def read_chunks():
+                with log_file as f:
+                    while True:
+                        chunk = f.read(LOG_VIEW_CHUNK_CHARS)
+                        if not chunk:
+                            return
+                        yield chunk
             
-            def block_edit(event):
-                if event.state & 0x4:
-                    return
-                if event.keysym in ('Left', 'Right', 'Up', 'Down', 'Home', 'End', 'Prior', 'Next'):
+            chunks = read_chunks()
+            
+            def insert_next_chunk():
+                if not log_window.winfo_exists():
+                    chunks.close()
                     return
-                return "break"
-            text_widget.bind("<Key>", block_edit)
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    text_widget.configure(state='normal')
+                    text_widget.insert(tk.END, chunk)
+                    text_widget.configure(state='disabled')  # Read-only view
+                    text_widget.see(tk.END)
+                    log_window.after_idle(insert_next_chunk)
+            
+            insert_next_chunk()  # First chunk now, so read errors are reported below
             
             close_btn = ttk.Button(log_window, text="Close", command=log_window.destroy)
             close_btn.pack(pady=5)
@@ -1733,8 +2792,13 @@ def main():
     logger.info(f"=" * 60)
     
     # Check if started from Windows Startup (minimized)
-    import sys
-    start_minimized = '--minimized' in sys.argv or '--startup' in sys.argv
+    start_minimized = not STARTUP_FLAGS.isdisjoint(sys.argv)
+    
+    # Derive the password key while Tk starts up and builds the window, instead of on
+    # the Tk thread when load_settings() decrypts the saved password (pbkdf2_hmac
+    # releases the GIL)
+    if AESGCM:
+        threading.Thread(target=_get_aes_key, daemon=True).start()
     
     root = tk.Tk()
     app = ConnectUploaderGUI(root)
@@ -1743,14 +2807,18 @@ def main():
     if start_minimized:
         logger.info("Started from Windows Startup - checking auto-start settings")
         try:
-            # Load config to check if auto-sync should start
-            if app.config.get('start_with_windows') and os.path.exists(CONFIG_FILE):
+            # The app loaded the config already (defaults, with auto-start off, if there is no file)
+            if app.config.get('start_with_windows'):
                 logger.info("Auto-start settings detected - starting monitoring and minimizing to tray")
                 # Start monitoring if credentials are set
                 if app.garmin_email.get() and app.garmin_password.get():
-                    root.after(500, lambda: app.start_monitoring() if not app.is_monitoring else None)
-                    root.after(800, lambda: root.withdraw())
-                    root.after(1000, lambda: app.create_tray_icon())
+                    def start_in_tray():
+                        if not app.is_monitoring:
+                            app.start_monitoring()
+                        root.withdraw()
+                        app.create_tray_icon()
+                    
+                    root.after(500, start_in_tray)
         except Exception as e:
             logger.error(f"Error during startup auto-start: {str(e)}")
     